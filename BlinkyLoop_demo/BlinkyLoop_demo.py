@@ -60,28 +60,238 @@ Demo Focus: This demo script primarily tests the NeoPixels' functionality. For a
 ====================================================
 """
 
+import gc
 import machine
+import micropython
 import neopixel
+import rp2
+import select
 import time
 import sys
+import urandom
 
 # ======================
 # Configuration Section
 # ======================
 NUM_PIXELS = 12      # Number of NeoPixels in the BlinkyLoop
 PIN_NUM = 3          # GPIO pin connected to NeoPixels
+PIO_SM_ID = 0        # PIO state machine used to clock out pixel data
+LATCH_US = 300       # Low time that makes the LEDs latch a frame
 
-# Initialize NeoPixel object
-np = neopixel.NeoPixel(machine.Pin(PIN_NUM), NUM_PIXELS)
+# ======================
+# PIO/DMA NeoPixel Driver
+# ======================
+
+# WS2812 bit timing from the Raspberry Pi Pico examples, 10 PIO cycles per
+# bit. Autopull every 8 bits so each DMA byte write (replicated across the
+# 32-bit FIFO word) clocks out exactly one byte, MSB first.
+@rp2.asm_pio(sideset_init=rp2.PIO.OUT_LOW, out_shiftdir=rp2.PIO.SHIFT_LEFT,
+             autopull=True, pull_thresh=8)
+def ws2812():
+    T1 = 2
+    T2 = 5
+    T3 = 3
+    wrap_target()
+    label("bitloop")
+    out(x, 1)               .side(0)    [T3 - 1]
+    jmp(not_x, "do_zero")   .side(1)    [T1 - 1]
+    jmp("bitloop")          .side(1)    [T2 - 1]
+    label("do_zero")
+    nop()                   .side(0)    [T2 - 1]
+    wrap()
+
+class DMANeoPixel(neopixel.NeoPixel):
+    """
+    NeoPixel strip clocked out by PIO and fed by DMA.
+    
+    write() copies the frame to a second buffer and starts a DMA transfer
+    to the PIO state machine, then returns at once. The caller can build
+    the next frame in `buf` while the current one is still being sent.
+    """
+    def __init__(self, pin, n, sm_id=PIO_SM_ID):
+        super().__init__(pin, n)
+        self.front = bytearray(len(self.buf))  # Frame being sent by DMA
+        self.sm = rp2.StateMachine(sm_id, ws2812, freq=8_000_000, sideset_base=pin)
+        self.sm.active(1)
+        self.dma = rp2.DMA()
+        # Pace the DMA by the state machine's TX FIFO data request
+        self.ctrl = self.dma.pack_ctrl(size=0, inc_write=False,
+                                       treq_sel=(sm_id >> 2) * 8 + (sm_id & 3))
+        # Bytes take 10 us each at 800 kHz, then the line must idle to latch
+        self.frame_us = len(self.buf) * 10 + LATCH_US
+        self.ready = time.ticks_us()
+
+    def write(self):
+        """Start sending `buf`, once the previous frame has been latched."""
+        while self.dma.active() or time.ticks_diff(self.ready, time.ticks_us()) > 0:
+            pass
+        self.front[:] = self.buf
+        self.dma.config(read=self.front, write=self.sm, count=len(self.front),
+                        ctrl=self.ctrl, trigger=True)
+        self.ready = time.ticks_add(time.ticks_us(), self.frame_us)
+
+# Initialize NeoPixel object; firmware without rp2.DMA keeps the stock driver
+if hasattr(rp2, "DMA"):
+    np = DMANeoPixel(machine.Pin(PIN_NUM), NUM_PIXELS)
+else:
+    np = neopixel.NeoPixel(machine.Pin(PIN_NUM), NUM_PIXELS)
+BUF = np.buf         # Raw pixel bytes, GRB order, 3 bytes per pixel
+OFF_FRAME = bytes(NUM_PIXELS * 3)
+
+# Watch the serial console so a keypress can interrupt a running animation
+stdin_poller = select.poll()
+stdin_poller.register(sys.stdin, select.POLLIN)
+
+class AnimationAborted(Exception):
+    """Raised between frames when input arrives during an animation."""
+
+# ======================
+# Color Wheel
+# ======================
+
+@micropython.viper
+def wheel(pos: int) -> int:
+    """
+    Generate rainbow colors across 0-255 positions.
+    
+    Args:
+        pos (int): Position on the color wheel (0-255).
+    
+    Returns:
+        int: Packed color as 0xRRGGBB.
+    """
+    if pos < 85:
+        return ((pos * 3) << 16) | ((255 - pos * 3) << 8)
+    elif pos < 170:
+        pos -= 85
+        return ((255 - pos * 3) << 16) | (pos * 3)
+    else:
+        pos -= 170
+        return ((pos * 3) << 8) | (255 - pos * 3)
+
+# All 256 wheel colors, 3 bytes each, in the NeoPixel buffer's GRB order
+WHEEL_LUT = bytearray(768)
+for _pos in range(256):
+    _c = wheel(_pos)
+    WHEEL_LUT[_pos * 3] = (_c >> 8) & 0xFF
+    WHEEL_LUT[_pos * 3 + 1] = (_c >> 16) & 0xFF
+    WHEEL_LUT[_pos * 3 + 2] = _c & 0xFF
+
+# Starting wheel position of each pixel so the rainbow spans the loop
+WHEEL_BASE = bytes(i * 256 // NUM_PIXELS for i in range(NUM_PIXELS))
 
 # ======================
 # Helper Functions
 # ======================
 
+def grb(color):
+    """
+    Convert an RGB color tuple to the NeoPixel buffer's byte order.
+    
+    Args:
+        color (tuple): RGB color tuple.
+    
+    Returns:
+        bytes: The color as 3 bytes in GRB order.
+    """
+    r, g, b = color
+    return bytes((g, r, b))
+
+def random_pixel(rand=urandom.getrandbits):
+    """
+    Pick a uniformly random pixel index.
+    
+    Draws 4 random bits and retries the out-of-range values instead of
+    folding them with a modulo, which would favor the low indices.
+    
+    Returns:
+        int: Pixel index in range(NUM_PIXELS).
+    """
+    idx = rand(4)
+    while idx >= NUM_PIXELS:
+        idx = rand(4)
+    return idx
+
+@micropython.viper
+def fill_rainbow(buf, j: int):
+    """
+    Write one rainbow frame straight into a NeoPixel buffer.
+    
+    Args:
+        buf (bytearray): NeoPixel backing buffer (GRB byte order).
+        j (int): Current offset on the color wheel.
+    """
+    p = ptr8(buf)
+    lut = ptr8(WHEEL_LUT)
+    base = ptr8(WHEEL_BASE)
+    n = int(len(WHEEL_BASE))
+    for i in range(n):
+        off = ((base[i] + j) & 255) * 3
+        p[i * 3] = lut[off]
+        p[i * 3 + 1] = lut[off + 1]
+        p[i * 3 + 2] = lut[off + 2]
+
+@micropython.viper
+def fill_fire(buf, n: int):
+    """
+    Write one fire flicker frame straight into a NeoPixel buffer.
+    
+    Args:
+        buf (bytearray): NeoPixel backing buffer (GRB byte order).
+        n (int): Number of pixels to fill.
+    """
+    p = ptr8(buf)
+    rand = urandom.getrandbits
+    for i in range(n):
+        brightness = int(rand(8)) >> 2
+        p[i * 3] = brightness >> 1
+        p[i * 3 + 1] = brightness
+        p[i * 3 + 2] = 0
+
+@micropython.viper
+def scale_frame(out, src, num: int, den: int):
+    """
+    Scale every byte of a frame by num/den into another buffer.
+    
+    Args:
+        out (bytearray): Destination buffer, same length as src.
+        src (bytes): Source frame.
+        num (int): Scale numerator.
+        den (int): Scale denominator.
+    """
+    o = ptr8(out)
+    s = ptr8(src)
+    n = int(len(src))
+    for i in range(n):
+        o[i] = (s[i] * num) // den
+
+def next_frame(deadline, wait):
+    """
+    Sleep until the next frame is due.
+    
+    Frames are scheduled `wait` ms apart from a fixed start, so time spent
+    drawing a frame comes out of the sleep instead of adding to it. The
+    sleep is a poll on stdin, so input arriving ends it early.
+    
+    Args:
+        deadline (int): Tick count (ms) the current frame was due at.
+        wait (int): Frame period in milliseconds.
+    
+    Returns:
+        int: Tick count the next frame is due at.
+    
+    Raises:
+        AnimationAborted: If input is waiting on stdin.
+    """
+    deadline = time.ticks_add(deadline, wait)
+    remaining = time.ticks_diff(deadline, time.ticks_ms())
+    if stdin_poller.poll(max(remaining, 0)):
+        raise AnimationAborted()
+    return deadline
+
 def clear_pixels():
     """Turn off all NeoPixels."""
-    for i in range(NUM_PIXELS):
-        np[i] = (0, 0, 0)
+    BUF[:] = OFF_FRAME
     np.write()
 
 def color_wipe(color, wait=50):
@@ -92,11 +302,14 @@ def color_wipe(color, wait=50):
         color (tuple): RGB color tuple.
         wait (int): Delay in milliseconds between each pixel.
     """
+    write = np.write
+    deadline = time.ticks_ms()
     for i in range(NUM_PIXELS):
         np[i] = color
-        np.write()
-        time.sleep_ms(wait)
+        write()
+        deadline = next_frame(deadline, wait)
 
+@micropython.native
 def rainbow_cycle(wait=20):
     """
     Draw rainbow that uniformly distributes itself across all pixels.
@@ -104,13 +317,14 @@ def rainbow_cycle(wait=20):
     Args:
         wait (int): Delay in milliseconds between each cycle step.
     """
+    write = np.write
+    deadline = time.ticks_ms()
     for j in range(256):
-        for i in range(NUM_PIXELS):
-            idx = (i * 256 // NUM_PIXELS) + j
-            np[i] = wheel(idx & 255)
-        np.write()
-        time.sleep_ms(wait)
+        fill_rainbow(BUF, j)
+        write()
+        deadline = next_frame(deadline, wait)
 
+@micropython.native
 def theater_chase(color, wait=50, iterations=10):
     """
     Movie theater light style chaser animation.
@@ -120,15 +334,20 @@ def theater_chase(color, wait=50, iterations=10):
         wait (int): Delay in milliseconds between each step.
         iterations (int): Number of chase iterations.
     """
+    lit = grb(color)
+    dark = bytes(3)
+    # Only three distinct frames exist; build them once and copy per step
+    frames = [
+        b"".join(lit if (i + q) % 3 == 0 else dark for i in range(NUM_PIXELS))
+        for q in range(3)
+    ]
+    write = np.write
+    deadline = time.ticks_ms()
     for _ in range(iterations):
-        for q in range(3):
-            for i in range(NUM_PIXELS):
-                if (i + q) % 3 == 0:
-                    np[i] = color
-                else:
-                    np[i] = (0, 0, 0)
-            np.write()
-            time.sleep_ms(wait)
+        for frame in frames:
+            BUF[:] = frame
+            write()
+            deadline = next_frame(deadline, wait)
     clear_pixels()
 
 def blink(color, wait=500, times=5):
@@ -140,28 +359,44 @@ def blink(color, wait=500, times=5):
         wait (int): Delay in milliseconds between on/off states.
         times (int): Number of blink cycles.
     """
+    deadline = time.ticks_ms()
     for _ in range(times):
         color_pixels(color)
-        time.sleep_ms(wait)
+        deadline = next_frame(deadline, wait)
         clear_pixels()
-        time.sleep_ms(wait)
+        deadline = next_frame(deadline, wait)
 
-def sparkle(color, wait=100, times=20):
+def sparkle(color, wait=100, times=20, count=1):
     """
-    Sparkle random pixels.
+    Sparkle (or twinkle) random pixels.
+    
+    Each frame turns off the pixels lit by the previous frame and lights
+    `count` new ones, so the strip is refreshed once per frame.
     
     Args:
         color (tuple): RGB color tuple.
         wait (int): Delay in milliseconds between sparkles.
         times (int): Number of sparkles.
+        count (int): Pixels lit per frame.
     """
-    import urandom
+    write = np.write
+    shown = bytearray(BUF)  # Frame currently on the strip
+    deadline = time.ticks_ms()
+    lit = []
     for _ in range(times):
-        idx = urandom.getrandbits(4) % NUM_PIXELS
-        np[idx] = color
-        np.write()
-        time.sleep_ms(wait)
+        for idx in lit:
+            np[idx] = (0, 0, 0)
+        lit = [random_pixel() for _ in range(count)]
+        for idx in lit:
+            np[idx] = color
+        # Re-picking the same pixels leaves the frame unchanged; skip the refresh
+        if BUF != shown:
+            shown[:] = BUF
+            write()
+        deadline = next_frame(deadline, wait)
+    for idx in lit:
         np[idx] = (0, 0, 0)
+    write()
 
 def fade(color, wait=20, steps=50):
     """
@@ -172,32 +407,18 @@ def fade(color, wait=20, steps=50):
         wait (int): Delay in milliseconds between fade steps.
         steps (int): Number of fade steps.
     """
-    r, g, b = color
+    # Full-brightness frame; each step writes a scaled copy of it into BUF
+    base = grb(color) * NUM_PIXELS
+    write = np.write
+    deadline = time.ticks_ms()
     for fade_val in range(steps):
-        scaled_color = (r * fade_val // steps, g * fade_val // steps, b * fade_val // steps)
-        color_pixels(scaled_color)
-        time.sleep_ms(wait)
+        scale_frame(BUF, base, fade_val, steps)
+        write()
+        deadline = next_frame(deadline, wait)
     for fade_val in range(steps, -1, -1):
-        scaled_color = (r * fade_val // steps, g * fade_val // steps, b * fade_val // steps)
-        color_pixels(scaled_color)
-        time.sleep_ms(wait)
-
-def twinkle(color, wait=100, times=20):
-    """
-    Twinkle random pixels multiple times.
-    
-    Args:
-        color (tuple): RGB color tuple.
-        wait (int): Delay in milliseconds between twinkles.
-        times (int): Number of twinkles.
-    """
-    import urandom
-    for _ in range(times):
-        idx = urandom.getrandbits(4) % NUM_PIXELS
-        np[idx] = color
-        np.write()
-        time.sleep_ms(wait)
-        np[idx] = (0, 0, 0)
+        scale_frame(BUF, base, fade_val, steps)
+        write()
+        deadline = next_frame(deadline, wait)
 
 def running_lights(color, wait=100, iterations=5):
     """
@@ -208,15 +429,19 @@ def running_lights(color, wait=100, iterations=5):
         wait (int): Delay in milliseconds between light movements.
         iterations (int): Number of complete runs.
     """
+    write = np.write
+    deadline = time.ticks_ms()
     for _ in range(iterations):
         for i in range(NUM_PIXELS):
             np[i] = color
-            if i > 0:
-                np[i-1] = (0, 0, 0)
-            np.write()
-            time.sleep_ms(wait)
-    clear_pixels()
-
+            np[i - 1 if i > 0 else NUM_PIXELS - 1] = (0, 0, 0)
+            write()
+            deadline = next_frame(deadline, wait)
+    # Only the last pixel is still lit; turn it off without a full clear.
+    np[NUM_PIXELS - 1] = (0, 0, 0)
+    write()
+
+@micropython.native
 def fire_effect(wait=50, iterations=50):
     """
     Simple fire-like flickering effect.
@@ -225,13 +450,29 @@ def fire_effect(wait=50, iterations=50):
         wait (int): Delay in milliseconds between flickers.
         iterations (int): Number of flicker cycles.
     """
-    import urandom
+    write = np.write
+    deadline = time.ticks_ms()
     for _ in range(iterations):
-        for i in range(NUM_PIXELS):
-            brightness = urandom.getrandbits(8) // 4
-            np[i] = (brightness, brightness // 2, 0)
-        np.write()
-        time.sleep_ms(wait)
+        fill_fire(BUF, NUM_PIXELS)
+        write()
+        deadline = next_frame(deadline, wait)
+
+PATTERN = [
+    (255, 0, 0),    # Red
+    (0, 255, 0),    # Green
+    (0, 0, 255),    # Blue
+    (255, 255, 0),  # Yellow
+    (0, 255, 255),  # Cyan
+    (255, 0, 255),  # Magenta
+    (192, 192, 192),# Silver
+    (128, 0, 0),    # Maroon
+    (128, 128, 0),  # Olive
+    (0, 128, 0),    # Dark Green
+    (128, 0, 128),  # Purple
+    (0, 128, 128)   # Teal
+]
+# The custom pattern as a ready-to-copy frame
+PATTERN_BUF = b"".join(grb(PATTERN[i % len(PATTERN)]) for i in range(NUM_PIXELS))
 
 def custom_pattern(wait=100):
     """
@@ -240,45 +481,11 @@ def custom_pattern(wait=100):
     Args:
         wait (int): Delay in milliseconds before clearing the pattern.
     """
-    pattern = [
-        (255, 0, 0),    # Red
-        (0, 255, 0),    # Green
-        (0, 0, 255),    # Blue
-        (255, 255, 0),  # Yellow
-        (0, 255, 255),  # Cyan
-        (255, 0, 255),  # Magenta
-        (192, 192, 192),# Silver
-        (128, 0, 0),    # Maroon
-        (128, 128, 0),  # Olive
-        (0, 128, 0),    # Dark Green
-        (128, 0, 128),  # Purple
-        (0, 128, 128)   # Teal
-    ]
-    for i in range(NUM_PIXELS):
-        np[i] = pattern[i % len(pattern)]
+    BUF[:] = PATTERN_BUF
     np.write()
-    time.sleep_ms(wait)
+    next_frame(time.ticks_ms(), wait)
     clear_pixels()
 
-def wheel(pos):
-    """
-    Generate rainbow colors across 0-255 positions.
-    
-    Args:
-        pos (int): Position on the color wheel (0-255).
-    
-    Returns:
-        tuple: RGB color tuple.
-    """
-    if pos < 85:
-        return (pos * 3, 255 - pos * 3, 0)
-    elif pos < 170:
-        pos -= 85
-        return (255 - pos * 3, 0, pos * 3)
-    else:
-        pos -= 170
-        return (0, pos * 3, 255 - pos * 3)
-
 def color_pixels(color):
     """
     Set all pixels to the specified color.
@@ -286,8 +493,7 @@ def color_pixels(color):
     Args:
         color (tuple): RGB color tuple.
     """
-    for i in range(NUM_PIXELS):
-        np[i] = color
+    BUF[:] = grb(color) * NUM_PIXELS
     np.write()
 
 # ======================
@@ -300,7 +506,7 @@ animations = {
     '4': ('Blink (Green)', lambda: blink((0, 255, 0))),
     '5': ('Sparkle (White)', lambda: sparkle((255, 255, 255))),
     '6': ('Fade (Purple)', lambda: fade((128, 0, 128))),
-    '7': ('Twinkle (Yellow)', lambda: twinkle((255, 255, 0))),
+    '7': ('Twinkle (Yellow)', lambda: sparkle((255, 255, 0))),
     '8': ('Running Lights (Orange)', lambda: running_lights((255, 165, 0))),
     '9': ('Fire Effect', fire_effect),
     '10': ('Custom Pattern', custom_pattern),
@@ -311,9 +517,9 @@ animations = {
 # User Interface
 # ======================
 
-def print_help():
-    """Display the help menu with available animations."""
-    print("\n=== NeoPixel Animation Help Menu ===")
+def build_help_text():
+    """Build the help menu text from the animation mapping."""
+    lines = ["\n=== NeoPixel Animation Help Menu ==="]
     # Sort keys: numeric keys first (sorted numerically), then 'h'
     sorted_keys = sorted(
         animations.keys(),
@@ -321,22 +527,37 @@ def print_help():
     )
     for key in sorted_keys:
         if key != 'h':
-            print(f"{key}: {animations[key][0]}")
-    print("h: Show Help Menu")
-    print("Enter the number corresponding to the animation you want to run.")
+            lines.append(f"{key}: {animations[key][0]}")
+    lines.append("h: Show Help Menu")
+    lines.append("Enter the number corresponding to the animation you want to run.")
+    return "\n".join(lines)
+
+# The animation mapping is fixed, so the help text is built only once
+HELP_TEXT = build_help_text()
+
+def print_help():
+    """Display the help menu with available animations."""
+    print(HELP_TEXT)
 
 def handle_input(cmd):
     """Process user input and trigger corresponding animations."""
     cmd = cmd.strip()
-    if cmd in animations:
-        if cmd == 'h':
-            print_help()
-        else:
-            print(f"\nTriggering Animation: {animations[cmd][0]}")
-            animations[cmd][1]()  # Execute the animation function
-            print(f"Animation '{animations[cmd][0]}' completed.\n")
-    else:
+    entry = animations.get(cmd)
+    if entry is None:
         print("Invalid command. Type 'h' for help.")
+    elif cmd == 'h':
+        print_help()
+    else:
+        name, func = entry
+        print(f"\nTriggering Animation: {name}")
+        try:
+            func()  # Execute the animation function
+            print(f"Animation '{name}' completed.\n")
+        except AnimationAborted:
+            # The pending input is read as the next command
+            clear_pixels()
+            print(f"Animation '{name}' interrupted.\n")
+        gc.collect()  # Reclaim the animation's temporaries before the next prompt
 
 # ======================
 # Main Execution
@@ -358,6 +579,7 @@ def main():
         except Exception as e:
             print(f"An error occurred: {e}")
             clear_pixels()
+            gc.collect()
 
 if __name__ == "__main__":
     main()
@@ -30,7 +30,7 @@ write_bytes_to_eeprom: Handles writing raw bytes to the EEPROM, managing page bo
 read_bytes_from_eeprom: Reads a specified number of bytes from the EEPROM.
 write_string_to_eeprom & read_string_from_eeprom: Facilitate writing and reading strings by encoding and decoding UTF-8 data.
 Section 5: Event Class Definition
-Purpose: Defines the Event class to encapsulate event-related data, including name, timings, speaker, and description.
+Purpose: Defines the Event class to encapsulate event-related data, including name, timings, speaker, and description. The UTF-8 encoded strings are cached on the event the first time it is saved.
 Section 6: Event Storage Functions
 Functions:
 save_event_to_eeprom: Serializes an Event object and saves it to the EEPROM.
@@ -64,6 +64,8 @@ Customization: Adjust EEPROM_I2C_ADDR, DS3231_I2C_ADDR, and pin configurations a
 
 
 from machine import I2C, Pin
+import gc
+import struct
 import time
 import sys
 
@@ -83,18 +85,26 @@ EEPROM_I2C_ADDR = 0x57        # Address for EEPROM (adjust based on EEPROM's add
 # EEPROM Specifications
 EEPROM_SIZE = 4096             # Total EEPROM size in bytes (4KB)
 PAGE_SIZE = 32                 # EEPROM page size (common sizes: 16, 32, 64 bytes)
+EVENT_SIZE = 250               # Maximum size of one serialized event in bytes
+EEPROM_WRITE_TIME_MS = 10      # Worst-case page write cycle time
+ERASED_PAGE = b'\xff' * PAGE_SIZE  # One page in the erased (all 0xFF) state
 
 # =============================================================================
 # Section 2: Utility Functions for BCD Conversion
 # =============================================================================
 
+# Lookup tables built once so conversions are a single index operation
+DEC_TO_BCD = bytes((val // 10 << 4) + (val % 10) for val in range(100))
+BCD_TO_DEC = bytes(((val >> 4) * 10) + (val & 0x0F) for val in range(256))
+RTC_BUF = bytearray(7)  # Reusable buffer for the seven DS3231 timekeeping registers
+
 def dec_to_bcd(val):
-    """Convert a decimal number to Binary-Coded Decimal (BCD)."""
-    return (val // 10 << 4) + (val % 10)
+    """Convert a decimal number (0-99) to Binary-Coded Decimal (BCD)."""
+    return DEC_TO_BCD[val]
 
 def bcd_to_dec(val):
     """Convert a Binary-Coded Decimal (BCD) number to decimal."""
-    return ((val >> 4) * 10) + (val & 0x0F)
+    return BCD_TO_DEC[val]
 
 # =============================================================================
 # Section 3: DS3231 RTC Functions
@@ -113,16 +123,16 @@ def set_time(year, month, date, day, hour, minute, second):
     - minute: Minute (0-59)
     - second: Second (0-59)
     """
-    year = year % 100  # Ensure two-digit year for DS3231
-    data = bytes([
-        dec_to_bcd(second),
-        dec_to_bcd(minute),
-        dec_to_bcd(hour),
-        dec_to_bcd(day),
-        dec_to_bcd(date),
-        dec_to_bcd(month),
-        dec_to_bcd(year)
-    ])
+    # Registers 0x00-0x06 in order, written in one burst; the DS3231 keeps a two-digit year
+    data = bytes((
+        DEC_TO_BCD[second],
+        DEC_TO_BCD[minute],
+        DEC_TO_BCD[hour],
+        DEC_TO_BCD[day],
+        DEC_TO_BCD[date],
+        DEC_TO_BCD[month],
+        DEC_TO_BCD[year % 100]
+    ))
     try:
         i2c.writeto_mem(DS3231_I2C_ADDR, 0x00, data)
         print("Time set successfully.")
@@ -138,14 +148,15 @@ def read_time():
     or None if reading fails.
     """
     try:
-        data = i2c.readfrom_mem(DS3231_I2C_ADDR, 0x00, 7)
-        second = bcd_to_dec(data[0])
-        minute = bcd_to_dec(data[1])
-        hour = bcd_to_dec(data[2])
-        day = bcd_to_dec(data[3])
-        date = bcd_to_dec(data[4])
-        month = bcd_to_dec(data[5] & 0x1F)
-        year = bcd_to_dec(data[6]) + 2000
+        data = RTC_BUF
+        i2c.readfrom_mem_into(DS3231_I2C_ADDR, 0x00, data)
+        second = BCD_TO_DEC[data[0]]
+        minute = BCD_TO_DEC[data[1]]
+        hour = BCD_TO_DEC[data[2]]
+        day = BCD_TO_DEC[data[3]]
+        date = BCD_TO_DEC[data[4]]
+        month = BCD_TO_DEC[data[5] & 0x1F]
+        year = BCD_TO_DEC[data[6]] + 2000
         # Uncomment the next line to print the read time
         # print(f"Read Time: {year}-{month:02}-{date:02} {hour:02}:{minute:02}:{second:02}")
         return (year, month, date, day, hour, minute, second)
@@ -157,25 +168,47 @@ def read_time():
 # Section 4: EEPROM Read/Write Functions
 # =============================================================================
 
+def wait_for_eeprom_write():
+    """
+    Wait for the EEPROM to finish its internal write cycle.
+    
+    The EEPROM does not acknowledge its address while a page write is in
+    progress, so poll it until it does. Gives up after the worst-case
+    write cycle time (EEPROM_WRITE_TIME_MS).
+    """
+    deadline = time.ticks_add(time.ticks_ms(), EEPROM_WRITE_TIME_MS)
+    while True:
+        try:
+            i2c.writeto(EEPROM_I2C_ADDR, b'')
+            return
+        except OSError:
+            if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+                return
+            time.sleep_us(200)
+
 def write_bytes_to_eeprom(address, data):
     """
     Write bytes to EEPROM starting at the specified address.
     
     Parameters:
     - address: Starting EEPROM address (integer)
-    - data: Bytearray of data to write
+    - data: Bytes, bytearray or memoryview of data to write
     """
-    while data:
-        chunk = data[:PAGE_SIZE]
-        data = data[PAGE_SIZE:]
+    # Slicing a memoryview references the data instead of copying it
+    data = memoryview(data)
+    offset = 0
+    while offset < len(data):
+        # A page write must not cross a page boundary or it wraps around
+        chunk_size = min(PAGE_SIZE - (address + offset) % PAGE_SIZE, len(data) - offset)
+        chunk = data[offset:offset + chunk_size]
         try:
             # Use writeto_mem with two-byte address for EEPROMs larger than 256 bytes
-            i2c.writeto_mem(EEPROM_I2C_ADDR, address, chunk, addrsize=16)
-            time.sleep_ms(10)  # Delay to ensure EEPROM write cycle completes
-            address += len(chunk)
+            i2c.writeto_mem(EEPROM_I2C_ADDR, address + offset, chunk, addrsize=16)
+            wait_for_eeprom_write()  # Returns as soon as the write cycle completes
         except OSError as e:
             print("Failed to write to EEPROM:", e)
             break
+        offset += chunk_size
     # Uncomment the next line to confirm successful write
     # print("Bytes written to EEPROM successfully.")
 
@@ -240,12 +273,40 @@ def read_string_from_eeprom(address, length):
 
 class Event:
     """Class representing a scheduled event."""
+    # Fixed attribute set: no per-instance __dict__ on ports that honour __slots__
+    __slots__ = ('event_name', 'start_time', 'end_time', 'speaker_name', 'description', '_encoded')
+
     def __init__(self, event_name, start_time, end_time, speaker_name, description):
         self.event_name = event_name
         self.start_time = start_time  # Epoch time (integer)
         self.end_time = end_time      # Epoch time (integer)
         self.speaker_name = speaker_name
         self.description = description
+        self._encoded = None          # UTF-8 fields, cached on first save
+
+    @classmethod
+    def from_start_duration(cls, event_name, start_time_tuple, duration_s, speaker_name, description):
+        """
+        Create an event from its start time tuple and duration in seconds.
+        
+        Only the start time goes through time.mktime; the end time is
+        derived from it by adding the duration.
+        """
+        start_time = int(time.mktime(start_time_tuple))
+        return cls(event_name, start_time, start_time + duration_s, speaker_name, description)
+
+    def encoded(self):
+        """
+        Return the UTF-8 encoded (event_name, speaker_name, description).
+        
+        Encoded once and cached, so saving the same event again does not
+        re-encode its strings.
+        """
+        if self._encoded is None:
+            self._encoded = (self.event_name.encode('utf-8'),
+                             self.speaker_name.encode('utf-8'),
+                             self.description.encode('utf-8'))
+        return self._encoded
 
 # =============================================================================
 # Section 6: Event Storage Functions
@@ -259,63 +320,92 @@ def save_event_to_eeprom(event, address):
     - event: Event object to save
     - address: Starting EEPROM address (integer)
     """
-    data = bytearray()
-    
-    # Serialize Event Name
-    event_name_bytes = event.event_name.encode('utf-8')
+    gc.collect()  # Free garbage before allocating the record
+    event_name_bytes, speaker_name_bytes, description_bytes = event.encoded()
     if len(event_name_bytes) > 50:
         print("Event name too long! Maximum 50 bytes allowed.")
         return
-    data.append(len(event_name_bytes))
-    data.extend(event_name_bytes)
-    
-    # Serialize Start Time (4 bytes)
-    data.extend(event.start_time.to_bytes(4, 'big'))
-    
-    # Serialize End Time (4 bytes)
-    data.extend(event.end_time.to_bytes(4, 'big'))
-    
-    # Serialize Speaker Name
-    speaker_name_bytes = event.speaker_name.encode('utf-8')
     if len(speaker_name_bytes) > 50:
         print("Speaker name too long! Maximum 50 bytes allowed.")
         return
-    data.append(len(speaker_name_bytes))
-    data.extend(speaker_name_bytes)
-    
-    # Serialize Description
-    description_bytes = event.description.encode('utf-8')
     if len(description_bytes) > 138:
         print("Description too long! Maximum 138 bytes allowed.")
         return
-    data.extend(len(description_bytes).to_bytes(2, 'big'))
-    data.extend(description_bytes)
     
+    # Size the record up front and fill it in place, so it is allocated once
+    size = 1 + len(event_name_bytes) + 4 + 4 + 1 + len(speaker_name_bytes) + 2 + len(description_bytes)
     # Ensure total data length does not exceed 250 bytes
-    if len(data) > 250:
-        print(f"Serialized event size {len(data)} exceeds 250 bytes. Cannot save.")
+    if size > EVENT_SIZE:
+        print(f"Serialized event size {size} exceeds {EVENT_SIZE} bytes. Cannot save.")
         return
+    data = bytearray(size)
+    offset = 0
+    
+    # Serialize Event Name
+    data[offset] = len(event_name_bytes)
+    offset += 1
+    data[offset:offset + len(event_name_bytes)] = event_name_bytes
+    offset += len(event_name_bytes)
+    
+    # Serialize Start Time, End Time (4 bytes each, big-endian) and Speaker Name Length
+    struct.pack_into('>IIB', data, offset, event.start_time, event.end_time, len(speaker_name_bytes))
+    offset += 9
+    
+    # Serialize Speaker Name
+    data[offset:offset + len(speaker_name_bytes)] = speaker_name_bytes
+    offset += len(speaker_name_bytes)
+    
+    # Serialize Description
+    struct.pack_into('>H', data, offset, len(description_bytes))
+    offset += 2
+    data[offset:offset + len(description_bytes)] = description_bytes
     
     # Write serialized data to EEPROM
     write_bytes_to_eeprom(address, data)
     print("Event saved successfully.")
 
+def decode_field(data, start, length, field):
+    """
+    Decode a UTF-8 string field from a record read out of EEPROM.
+    
+    Parameters:
+    - data: Bytes of the whole record
+    - start: Offset of the field within the record (integer)
+    - length: Length of the field in bytes (integer)
+    - field: Field name used in error messages
+    
+    Returns:
+    Decoded string or None if the field is truncated or not valid UTF-8.
+    """
+    if start + length > len(data):
+        print(f"Invalid {field}: record truncated at offset {start}.")
+        return None
+    try:
+        return data[start:start + length].decode('utf-8')
+    except ValueError as e:
+        print(f"Invalid {field}: failed to decode string from EEPROM:", e)
+        return None
+
 def load_event_from_eeprom(address):
     """
     Load and deserialize an event from EEPROM starting at the specified address.
     
+    The whole record is fetched in one I2C read and parsed in memory.
+    
     Parameters:
     - address: Starting EEPROM address (integer)
     
     Returns:
     Event object if successful, otherwise None.
     """
-    # Read Event Name Length
-    event_name_length_bytes = read_bytes_from_eeprom(address, 1)
-    if event_name_length_bytes is None:
-        print("Failed to read event name length.")
+    gc.collect()  # Free garbage before allocating the record
+    data = read_bytes_from_eeprom(address, min(EVENT_SIZE, EEPROM_SIZE - address))
+    if not data:
+        print("Failed to read event from EEPROM.")
         return None
-    event_name_length = event_name_length_bytes[0]
+    
+    # Event Name Length
+    event_name_length = data[0]
     
     # Check if the entire event slot is empty (all bytes set to 0xFF)
     if event_name_length == 0xFF:
@@ -326,70 +416,49 @@ def load_event_from_eeprom(address):
     if event_name_length == 0 or event_name_length > 50:
         print(f"Invalid event name length ({event_name_length}) at address {address}.")
         return None
-    address += 1
+    offset = 1
     
-    # Read Event Name
-    event_name = read_string_from_eeprom(address, event_name_length)
+    # Event Name
+    event_name = decode_field(data, offset, event_name_length, "event name")
     if event_name is None:
-        print(f"Invalid event name at address {address}.")
         return None
-    address += event_name_length
+    offset += event_name_length
     
-    # Read Start Time
-    start_time_bytes = read_bytes_from_eeprom(address, 4)
-    if start_time_bytes is None or len(start_time_bytes) != 4:
-        print("Failed to read start time.")
+    # Start Time, End Time and Speaker Name Length
+    if offset + 9 > len(data):
+        print("Failed to read event times.")
         return None
-    start_time = int.from_bytes(start_time_bytes, 'big')
-    address += 4
-    
-    # Read End Time
-    end_time_bytes = read_bytes_from_eeprom(address, 4)
-    if end_time_bytes is None or len(end_time_bytes) != 4:
-        print("Failed to read end time.")
-        return None
-    end_time = int.from_bytes(end_time_bytes, 'big')
-    address += 4
-    
-    # Read Speaker Name Length
-    speaker_name_length_bytes = read_bytes_from_eeprom(address, 1)
-    if speaker_name_length_bytes is None:
-        print("Failed to read speaker name length.")
-        return None
-    speaker_name_length = speaker_name_length_bytes[0]
+    start_time, end_time, speaker_name_length = struct.unpack_from('>IIB', data, offset)
+    offset += 8
     
     # Validate speaker_name_length
     if speaker_name_length == 0 or speaker_name_length > 50:
-        print(f"Invalid speaker name length ({speaker_name_length}) at address {address}.")
+        print(f"Invalid speaker name length ({speaker_name_length}) at address {address + offset}.")
         return None
-    address += 1
+    offset += 1
     
-    # Read Speaker Name
-    speaker_name = read_string_from_eeprom(address, speaker_name_length)
+    # Speaker Name
+    speaker_name = decode_field(data, offset, speaker_name_length, "speaker name")
     if speaker_name is None:
-        print(f"Invalid speaker name at address {address}.")
         return None
-    address += speaker_name_length
+    offset += speaker_name_length
     
-    # Read Description Length
-    description_length_bytes = read_bytes_from_eeprom(address, 2)
-    if description_length_bytes is None or len(description_length_bytes) != 2:
+    # Description Length
+    if offset + 2 > len(data):
         print("Failed to read description length.")
         return None
-    description_length = int.from_bytes(description_length_bytes, 'big')
+    description_length = struct.unpack_from('>H', data, offset)[0]
     
     # Validate description_length
     if description_length == 0 or description_length > 138:
-        print(f"Invalid description length ({description_length}) at address {address}.")
+        print(f"Invalid description length ({description_length}) at address {address + offset}.")
         return None
-    address += 2
+    offset += 2
     
-    # Read Description
-    description = read_string_from_eeprom(address, description_length)
+    # Description
+    description = decode_field(data, offset, description_length, "description")
     if description is None:
-        print(f"Invalid description at address {address}.")
         return None
-    address += description_length
     
     # Create Event Object
     event = Event(event_name, start_time, end_time, speaker_name, description)
@@ -405,13 +474,13 @@ def wipe_eeprom():
     Erase all data in the EEPROM without user confirmation.
     Fills the EEPROM with 0xFF bytes.
     """
+    gc.collect()
     print("Wiping EEPROM...")
     # Iterate through the entire EEPROM in PAGE_SIZE chunks
     for addr in range(0, EEPROM_SIZE, PAGE_SIZE):
         remaining = EEPROM_SIZE - addr
-        chunk_size = PAGE_SIZE if remaining >= PAGE_SIZE else remaining
-        # Create a chunk filled with 0xFF
-        chunk = bytearray([0xFF] * chunk_size)
+        # Reuse the shared erased page instead of allocating one per chunk
+        chunk = ERASED_PAGE if remaining >= PAGE_SIZE else ERASED_PAGE[:remaining]
         try:
             write_bytes_to_eeprom(addr, chunk)
         except Exception as e:
@@ -460,16 +529,13 @@ def main():
     event_name = "Ceremony"
     # Event start time: November 3, 2024, at 5:00 PM
     start_time_tuple = (2024, 11, 3, 17, 0, 0, 0, 0)
-    start_time = int(time.mktime(start_time_tuple))
-    
-    # Event end time: November 3, 2024, at 6:00 PM
-    end_time_tuple = (2024, 11, 3, 18, 0, 0, 0, 0)
-    end_time = int(time.mktime(end_time_tuple))
+    # Event end time: November 3, 2024, at 6:00 PM (one hour later)
+    duration_s = 3600
     
     speaker_name = "Elliot"
     description = "Badges!"
     
-    event = Event(event_name, start_time, end_time, speaker_name, description)
+    event = Event.from_start_duration(event_name, start_time_tuple, duration_s, speaker_name, description)
     
     # Step 5: Save event to EEPROM at address 0
     address = 0
@@ -35,18 +35,22 @@ Repository: Link to the GitHub repository for more information.
 python
 Copy code
 from machine import I2C, Pin
+import select
+import struct
 import time
 import sys
 machine: Provides access to hardware-related functions, specifically I2C and Pin control.
 time: For handling time-related functions like delays and timestamp conversions.
 sys: Allows for system-level operations like exiting the program.
+select: Polls stdin for keypresses, so read_line can run input_idle while waiting for input.
 3. Initialization
 I2C Interface Setup
 python
 Copy code
-i2c = I2C(0, scl=Pin(1), sda=Pin(0), freq=400000)  # Adjust as per your board
+i2c = init_i2c()
 Initializes the I2C bus with specified SCL and SDA pins and sets the frequency to 400kHz.
-Note: The pins and frequency might need adjustment based on the specific hardware setup.
+If USE_FAST_I2C is set to True, it first tries 1MHz (Fast-mode Plus) and falls back to 400kHz unless both the RTC and the EEPROM respond.
+Note: The pins and frequency might need adjustment based on the specific hardware setup. The DS3231 is only rated for 400kHz.
 Device Addresses and EEPROM Specifications
 python
 Copy code
@@ -63,11 +67,14 @@ PAGE_SIZE: The size of each EEPROM page, important for write operations.
 BCD Conversion
 python
 Copy code
+DEC_TO_BCD = bytes((val // 10 << 4) + (val % 10) for val in range(100))
+BCD_TO_DEC = bytes(((val >> 4) * 10) + (val & 0x0F) for val in range(256))
+
 def dec_to_bcd(val):
-    return (val // 10 << 4) + (val % 10)
+    return DEC_TO_BCD[val]
 
 def bcd_to_dec(val):
-    return ((val >> 4) * 10) + (val & 0x0F)
+    return BCD_TO_DEC[val]
 dec_to_bcd: Converts a decimal number to Binary-Coded Decimal (BCD) format.
 bcd_to_dec: Converts a BCD number back to decimal format.
 Purpose: The DS3231 RTC uses BCD for time representation, so these functions facilitate conversions.
@@ -79,24 +86,24 @@ def set_time(year, month, date, day, hour, minute, second):
     ...
 Parameters: Full date and time components.
 Process: Converts each component to BCD and writes them to the DS3231 registers.
-Error Handling: Catches and reports any I/O errors during the write operation.
+Error Handling: I/O errors are raised as OSError and reported by main().
 Reading the Time
 python
 Copy code
 def read_time():
     ...
 Process: Reads 7 bytes from the DS3231 starting at register 0x00, converts them from BCD to decimal.
-Returns: A tuple containing the current time or None if reading fails.
-Error Handling: Catches and reports any I/O errors during the read operation.
+Returns: A tuple containing the current time.
+Error Handling: I/O errors are raised as OSError and reported by main().
 Reading the Temperature
 python
 Copy code
 def read_temperature():
     ...
-Process: Reads temperature registers (0x11 and 0x12) from the DS3231.
-Calculation: Combines MSB and LSB to get the temperature in Celsius.
-Returns: Temperature value or None if reading fails.
-Error Handling: Catches and reports any I/O errors during the read operation.
+Process: Reads temperature registers (0x11 and 0x12) from the DS3231 in a single transaction.
+Calculation: Combines the signed MSB and the LSB fraction to get the temperature in Celsius.
+Returns: Temperature value.
+Error Handling: I/O errors are raised as OSError and reported by main().
 6. EEPROM Read/Write Functions
 Writing Bytes to EEPROM
 python
@@ -104,17 +111,18 @@ Copy code
 def write_bytes_to_eeprom(address, data):
     ...
 Parameters: Starting address and data to write.
-Process: Writes data in chunks defined by PAGE_SIZE to handle EEPROM page boundaries.
-Delay: Introduces a 10ms delay after each write to ensure the EEPROM completes its write cycle.
-Error Handling: Catches and reports any I/O errors during the write operation.
+Process: Writes data one EEPROM page per transaction, splitting chunks at page boundaries.
+Delay: Polls the EEPROM after each page write until it acknowledges again, i.e. its write cycle is complete.
+Error Handling: I/O errors are raised as OSError and reported by main().
 Reading Bytes from EEPROM
 python
 Copy code
 def read_bytes_from_eeprom(address, length):
     ...
 Parameters: Starting address and number of bytes to read.
-Returns: The data read or None if reading fails.
-Error Handling: Catches and reports any I/O errors during the read operation.
+Returns: The data read.
+Error Handling: I/O errors are raised as OSError and reported by main().
+read_eeprom_into(address, buf) does the same into an existing buffer, so page-by-page scans reuse one PAGE_BUF and event loads reuse one EVENT_BUF.
 Writing and Reading Strings
 python
 Copy code
@@ -138,24 +146,35 @@ start_time: Event start time in Epoch format.
 end_time: Event end time in Epoch format.
 speaker_name: Name of the speaker.
 description: Description of the event.
+start_str / end_str: Formatted start and end times, computed on first use and cached.
 Purpose: Encapsulates all relevant information about a calendar event.
 Saving an Event to EEPROM
 python
 Copy code
-def save_event_to_eeprom(event, address):
+def save_event_to_eeprom(event, address, verify=None):
     ...
 Process:
-Serializes the Event object into a bytearray with specific length constraints.
-Writes the serialized data to EEPROM at the specified address.
-Optionally verifies the write operation by reading back the data and comparing.
+Serializes the Event object with a single struct.pack call, enforcing specific length constraints.
+Writes the serialized data to EEPROM at the specified address and marks the slot as used in the RAM slot directory.
+If verify is True, checks the write operation by reading back the data and comparing. By default this follows DEBUG, since it doubles the I2C traffic of every save; without it, a failed or corrupted write goes unnoticed.
 Error Handling: Checks for data size limits and handles I/O errors.
+Saving Many Events at Once
+python
+Copy code
+def save_events_batch(events, start_address=0, slot_size=EVENT_SIZE):
+    ...
+Process:
+Packs every event into its slot of one 0xFF-filled buffer with struct.pack_into.
+Writes the whole buffer with a single write_bytes_to_eeprom call, e.g. to load a full conference schedule.
+Error Handling: Saves nothing if any event is invalid, larger than its slot, or the events do not fit in the EEPROM.
+A batch that does not use standard EVENT_SIZE slots drops the RAM slot directory, so it is rebuilt on next use.
 Loading an Event from EEPROM
 python
 Copy code
 def load_event_from_eeprom(address):
     ...
 Process:
-Deserializes data from EEPROM starting at the specified address.
+Reads the whole event slot in a single EEPROM read and deserializes it in memory, unpacking the fixed-size fields with struct.unpack_from.
 Reconstructs an Event object if valid data is found.
 Error Handling: Validates lengths and content at each step, reporting issues as they arise.
 Listing All Events
@@ -167,7 +186,7 @@ Parameters:
 start_address: EEPROM address to begin listing events.
 max_events: Maximum number of events to list.
 event_size: Allocated size per event in EEPROM.
-Process: Iterates through EEPROM slots, attempting to load and display each event.
+Process: Iterates through EEPROM slots, attempting to load and display each event. Slots that the RAM slot directory knows to be empty are skipped without an EEPROM read; outside the directory, a one-byte slot_is_empty() probe skips erased slots.
 Output: Prints details of each valid event or indicates if no data is found.
 8. I2C Bus Functions
 python
@@ -180,30 +199,50 @@ Output: Prints a list of found I2C devices or indicates if none are found.
 Wiping the EEPROM
 python
 Copy code
-def wipe_eeprom():
+def wipe_eeprom(verify=True):
     ...
 Process:
 Prompts the user for confirmation before proceeding.
-Writes 0xFF to every byte in EEPROM in chunks defined by PAGE_SIZE.
-Verifies the wipe by checking specific addresses.
+Writes 0xFF to every EEPROM page that is not already erased, one PAGE_SIZE chunk at a time.
+Unless verify is False, checks the wipe by reading back one page every 512 bytes.
 Safety: Ensures the user is aware that this operation will erase all data.
 Error Handling: Reports any failures during the wipe or verification process.
 10. Interactive Menu Functions
+Prompt Helpers
+python
+Copy code
+def prompt_datetime(label):
+    ...
+def prompt_epoch(label):
+    ...
+def prompt_bounded_str(label, max_bytes):
+    ...
+Purpose: Read a date and time as one "YYYY-MM-DD HH:MM:SS" line (parsed by parse_datetime(), so a typo in one field only means retyping one line), prompt for an event's start/end time (converted to Epoch time) and for its text fields (checked against their maximum encoded length), so the event entry menu option does not repeat the same prompts.
 Displaying the Menu
 python
 Copy code
 def print_menu():
     ...
 Purpose: Shows available options to the user for interacting with the badge's functionalities.
+Menu Handlers
+python
+Copy code
+def handle_set_time():
+    ...
+def handle_write_event():
+    ...
+MENU_ACTIONS = {...}
+Purpose: Each menu option is its own handler function; MENU_ACTIONS maps the choice string to the handler, with None for Exit. Adding an option means adding a handler and one table entry.
 Main Interactive Loop
 python
 Copy code
-def main():
+def main(idle=None):
     ...
 Process:
 Continuously displays the menu and prompts the user for input.
-Executes functions based on user selection.
+Looks up the selected option in MENU_ACTIONS, which maps each menu choice to its handler function (handle_set_time(), handle_write_event(), ...), and calls it.
 Handles invalid inputs and exceptions gracefully.
+Reads input through read_line(), which calls the optional idle function while a prompt waits, so work such as a display refresh is not frozen by input().
 Provides options to set/read time, manage events, scan I2C, wipe EEPROM, and exit.
 User Interaction: Ensures a user-friendly interface for managing the badge's features.
 11. Entry Point
@@ -213,15 +252,18 @@ if __name__ == "__main__":
     main()
 Purpose: Ensures that the main function runs only when the script is executed directly, not when imported as a module.
 Additional Notes
-Event Storage Strategy: Each event is allocated 250 bytes in EEPROM, allowing for up to 16 events in a 4KB EEPROM.
+Event Storage Strategy: Each event is allocated 250 bytes in EEPROM, allowing for up to 16 events in a 4KB EEPROM. The record layout and its big-endian byte order are defined next to EVENT_SIZE and shared with CalendarReset.py.
 Data Validation: The script performs thorough validation of input data, ensuring that strings do not exceed their maximum allowed lengths and that numerical inputs are within valid ranges.
-Error Handling: Throughout the script, exceptions are caught and informative messages are printed to aid in debugging and user guidance.
+Error Handling: The I2C helpers raise OSError instead of printing and returning None; main() catches it once per menu action and prints an informative message. Input errors are still caught where the input is read.
+Debug Output: Progress messages (per wiped page, per loaded field) are printed only when DEBUG is set to True, since serial output is slower than the I2C work itself.
 Extensibility: The modular design allows for easy addition of new features or integration with other SAOs.
 
 '''
 
 # Import Necessary Libraries
 from machine import I2C, Pin
+import select
+import struct
 import time
 import sys
 
@@ -229,31 +271,82 @@ import sys
 # Initialization
 # ======================================
 
-# Initialize I2C Interface
-# Adjust scl and sda pins based on your hardware setup
-# Example for ESP8266: scl=Pin(1), sda=Pin(0)
-i2c = I2C(0, scl=Pin(1), sda=Pin(0), freq=400000)  # Adjust as per your board
-
 # Define I2C Addresses for Devices
 DS3231_I2C_ADDR = 0x68    # DS3231 RTC I2C address
 EEPROM_I2C_ADDR = 0x57     # EEPROM I2C address (adjust based on EEPROM's address pins)
 
+# I2C Bus Speed
+# Fast-mode Plus (1 MHz) speeds up EEPROM transfers on parts that support it,
+# but the DS3231 is only rated for 400 kHz, so it has to be enabled explicitly.
+I2C_FREQ = 400000           # Standard fast mode
+I2C_FAST_FREQ = 1000000     # Fast-mode Plus
+USE_FAST_I2C = False        # Set to True to try Fast-mode Plus first
+
+def init_i2c():
+    """
+    Initialize the I2C bus, trying Fast-mode Plus first if USE_FAST_I2C is set.
+
+    Both devices must answer at the higher speed; otherwise the bus falls
+    back to I2C_FREQ.
+
+    Returns:
+    - I2C: The initialized bus
+    """
+    # Adjust scl and sda pins based on your hardware setup
+    # Example for ESP8266: scl=Pin(1), sda=Pin(0)
+    if USE_FAST_I2C:
+        bus = I2C(0, scl=Pin(1), sda=Pin(0), freq=I2C_FAST_FREQ)
+        try:
+            bus.readfrom_mem(DS3231_I2C_ADDR, 0x00, 1)
+            bus.readfrom_mem(EEPROM_I2C_ADDR, 0, 1, addrsize=16)
+            return bus
+        except OSError:
+            print(f"I2C devices did not respond at {I2C_FAST_FREQ} Hz, falling back to {I2C_FREQ} Hz.")
+    return I2C(0, scl=Pin(1), sda=Pin(0), freq=I2C_FREQ)
+
+# Initialize I2C Interface
+i2c = init_i2c()
+
 # EEPROM Specifications
 EEPROM_SIZE = 4096          # Total EEPROM size in bytes (4KB)
 PAGE_SIZE = 32              # EEPROM page size (common sizes: 16, 32, 64 bytes)
+EEPROM_WRITE_TIME_MS = 10   # Worst-case EEPROM page write cycle time
+ERASED_PAGE = b'\xff' * PAGE_SIZE  # One page in the erased (all 0xFF) state
+PAGE_BUF = bytearray(PAGE_SIZE)    # Reusable buffer for page-sized reads
+EVENT_SIZE = 250            # Space allocated to each event in EEPROM
+NUM_SLOTS = (EEPROM_SIZE + EVENT_SIZE - 1) // EVENT_SIZE  # Event slots, including the short one at the end
+EVENT_BUF = bytearray(EVENT_SIZE)  # Reusable buffer for whole-slot event reads
+
+# Event record layout in EEPROM:
+#   name length (1) | name | start time (4) | end time (4) |
+#   speaker length (1) | speaker | description length (2) | description
+# Multi-byte fields are big-endian. CalendarReset.py writes the conference
+# schedule in this format, so it must not change here on its own.
+EVENT_BYTE_ORDER = '>'
+EVENT_TIMES_FORMAT = EVENT_BYTE_ORDER + 'IIB'      # start time, end time, speaker length
+EVENT_DESC_LEN_FORMAT = EVENT_BYTE_ORDER + 'H'     # description length
+
+# Progress and diagnostic output. Each print goes out over the serial
+# console, which is far slower than the I2C traffic it describes.
+DEBUG = False
 
 # ======================================
 # Helper Functions
 # ======================================
 
 # BCD (Binary-Coded Decimal) Conversion Functions
+# Lookup tables built once so conversions are a single index operation
+DEC_TO_BCD = bytes((val // 10 << 4) + (val % 10) for val in range(100))
+BCD_TO_DEC = bytes(((val >> 4) * 10) + (val & 0x0F) for val in range(256))
+RTC_BUF = bytearray(7)  # Reusable buffer for the seven DS3231 timekeeping registers
+
 def dec_to_bcd(val):
-    """Convert a decimal number to BCD."""
-    return (val // 10 << 4) + (val % 10)
+    """Convert a decimal number (0-99) to BCD."""
+    return DEC_TO_BCD[val]
 
 def bcd_to_dec(val):
     """Convert a BCD number to decimal."""
-    return ((val >> 4) * 10) + (val & 0x0F)
+    return BCD_TO_DEC[val]
 
 # ======================================
 # DS3231 Real-Time Clock (RTC) Functions
@@ -271,88 +364,114 @@ def set_time(year, month, date, day, hour, minute, second):
     - hour (int): Hour (0-23)
     - minute (int): Minute (0-59)
     - second (int): Second (0-59)
+
+    Raises:
+    - ValueError: if a field other than the year is outside 0-99 (not BCD-encodable)
+    - OSError: if the I2C write fails
     """
-    year = year % 100  # Ensure two-digit year
-    data = bytes([
-        dec_to_bcd(second),
-        dec_to_bcd(minute),
-        dec_to_bcd(hour),
-        dec_to_bcd(day),
-        dec_to_bcd(date),
-        dec_to_bcd(month),
-        dec_to_bcd(year)
-    ])
-    try:
-        i2c.writeto_mem(DS3231_I2C_ADDR, 0x00, data)
-        print("Time set successfully.")
-    except OSError as e:
-        print("Failed to set time:", e)
+    for value in (month, date, day, hour, minute, second):
+        if not 0 <= value <= 99:
+            raise ValueError("time field out of range: {}".format(value))
+    # Registers 0x00-0x06 in order, written in one burst; the DS3231 keeps a two-digit year
+    data = bytes((
+        DEC_TO_BCD[second],
+        DEC_TO_BCD[minute],
+        DEC_TO_BCD[hour],
+        DEC_TO_BCD[day],
+        DEC_TO_BCD[date],
+        DEC_TO_BCD[month],
+        DEC_TO_BCD[year % 100]
+    ))
+    i2c.writeto_mem(DS3231_I2C_ADDR, 0x00, data)
+    print("Time set successfully.")
 
 def read_time():
     """
     Read the current time from DS3231 RTC.
 
     Returns:
-    - tuple: (year, month, date, day, hour, minute, second) if successful
-    - None: if reading fails
+    - tuple: (year, month, date, day, hour, minute, second)
+
+    Raises:
+    - OSError: if the I2C read fails
     """
-    try:
-        data = i2c.readfrom_mem(DS3231_I2C_ADDR, 0x00, 7)
-        second = bcd_to_dec(data[0])
-        minute = bcd_to_dec(data[1])
-        hour = bcd_to_dec(data[2])
-        day = bcd_to_dec(data[3])
-        date = bcd_to_dec(data[4])
-        month = bcd_to_dec(data[5] & 0x1F)
-        year = bcd_to_dec(data[6]) + 2000
+    data = RTC_BUF
+    i2c.readfrom_mem_into(DS3231_I2C_ADDR, 0x00, data)
+    second = BCD_TO_DEC[data[0]]
+    minute = BCD_TO_DEC[data[1]]
+    hour = BCD_TO_DEC[data[2]]
+    day = BCD_TO_DEC[data[3]]
+    date = BCD_TO_DEC[data[4]]
+    month = BCD_TO_DEC[data[5] & 0x1F]
+    year = BCD_TO_DEC[data[6]] + 2000
+    if DEBUG:
         print(f"Read Time: {year}-{month:02}-{date:02} {hour:02}:{minute:02}:{second:02}")
-        return (year, month, date, day, hour, minute, second)
-    except OSError as e:
-        print("Failed to read time:", e)
-        return None
+    return (year, month, date, day, hour, minute, second)
 
 def read_temperature():
     """
     Read the temperature from DS3231 RTC.
 
     Returns:
-    - float: Temperature in Celsius if successful
-    - None: if reading fails
+    - float: Temperature in Celsius
+
+    Raises:
+    - OSError: if the I2C read fails
     """
-    try:
-        temp_msb = i2c.readfrom_mem(DS3231_I2C_ADDR, 0x11, 1)[0]
-        temp_lsb = i2c.readfrom_mem(DS3231_I2C_ADDR, 0x12, 1)[0]
-        temp = temp_msb + ((temp_lsb >> 6) * 0.25)
+    # MSB (0x11) and LSB (0x12) are consecutive, so read both at once
+    temp_msb, temp_lsb = i2c.readfrom_mem(DS3231_I2C_ADDR, 0x11, 2)
+    # MSB is a two's complement integer part; convert for sub-zero values
+    if temp_msb & 0x80:
+        temp_msb -= 256
+    temp = temp_msb + ((temp_lsb >> 6) * 0.25)
+    if DEBUG:
         print(f"Read Temperature: {temp:.2f}°C")
-        return temp
-    except OSError as e:
-        print("Failed to read temperature:", e)
-        return None
+    return temp
 
 # ======================================
 # EEPROM Read/Write Functions
 # ======================================
 
+def wait_for_eeprom_write():
+    """
+    Wait for the EEPROM to finish its internal write cycle.
+
+    The EEPROM does not acknowledge its address while a page write is in
+    progress, so poll it until it does (ACK polling). Gives up after the
+    worst-case write cycle time.
+    """
+    deadline = time.ticks_add(time.ticks_ms(), EEPROM_WRITE_TIME_MS)
+    while True:
+        try:
+            i2c.writeto(EEPROM_I2C_ADDR, b'')
+            return
+        except OSError:
+            if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+                return
+            time.sleep_us(200)
+
 def write_bytes_to_eeprom(address, data):
     """
     Write bytes to EEPROM starting at the specified address.
 
     Parameters:
     - address (int): EEPROM address to start writing
-    - data (bytes or bytearray): Data to write
+    - data (bytes, bytearray or memoryview): Data to write
+
+    Raises:
+    - OSError: if an I2C write fails
     """
-    while data:
-        chunk = data[:PAGE_SIZE]
-        data = data[PAGE_SIZE:]
-        try:
-            # Use writeto_mem with two-byte address for EEPROMs larger than 256 bytes
-            i2c.writeto_mem(EEPROM_I2C_ADDR, address, chunk, addrsize=16)
-            time.sleep_ms(10)  # Delay to ensure EEPROM write cycle completes
-            address += len(chunk)
-        except OSError as e:
-            print("Failed to write to EEPROM:", e)
-            break
-    print("Bytes written to EEPROM successfully.")
+    mv = memoryview(data)  # Page slices reference data instead of copying it
+    offset = 0
+    while offset < len(mv):
+        # Send one whole page per transaction, never crossing a page boundary
+        n = min(PAGE_SIZE - (address + offset) % PAGE_SIZE, len(mv) - offset)
+        # Use writeto_mem with two-byte address for EEPROMs larger than 256 bytes
+        i2c.writeto_mem(EEPROM_I2C_ADDR, address + offset, mv[offset:offset + n], addrsize=16)
+        wait_for_eeprom_write()  # Returns as soon as the write cycle completes
+        offset += n
+    if DEBUG:
+        print("Bytes written to EEPROM successfully.")
 
 def read_bytes_from_eeprom(address, length):
     """
@@ -364,15 +483,25 @@ def read_bytes_from_eeprom(address, length):
 
     Returns:
     - bytes: Data read from EEPROM
-    - None: if reading fails
+
+    Raises:
+    - OSError: if the I2C read fails
     """
-    try:
-        # Use readfrom_mem with two-byte address for EEPROMs larger than 256 bytes
-        data = i2c.readfrom_mem(EEPROM_I2C_ADDR, address, length, addrsize=16)
-        return data
-    except OSError as e:
-        print("Failed to read from EEPROM:", e)
-        return None
+    # Use readfrom_mem with two-byte address for EEPROMs larger than 256 bytes
+    return i2c.readfrom_mem(EEPROM_I2C_ADDR, address, length, addrsize=16)
+
+def read_eeprom_into(address, buf):
+    """
+    Read len(buf) bytes from EEPROM into an existing buffer, without allocating.
+
+    Parameters:
+    - address (int): EEPROM address to start reading
+    - buf (bytearray): Buffer to fill
+
+    Raises:
+    - OSError: if the I2C read fails
+    """
+    i2c.readfrom_mem_into(EEPROM_I2C_ADDR, address, buf, addrsize=16)
 
 def write_string_to_eeprom(address, string):
     """
@@ -396,18 +525,16 @@ def read_string_from_eeprom(address, length):
 
     Returns:
     - str: Decoded string
-    - None: if reading or decoding fails
+    - None: if decoding fails
+
+    Raises:
+    - OSError: if the I2C read fails
     """
     data = read_bytes_from_eeprom(address, length)
-    if data is not None and len(data) == length:
-        try:
-            string = data.decode('utf-8')
-            return string
-        except ValueError as e:
-            print("Failed to decode string from EEPROM:", e)
-            return None
-    else:
-        print(f"Failed to read {length} bytes from EEPROM at address {address}")
+    try:
+        return data.decode('utf-8')
+    except ValueError as e:
+        print("Failed to decode string from EEPROM:", e)
         return None
 
 # ======================================
@@ -425,73 +552,239 @@ class Event:
     - speaker_name (str): Name of the speaker
     - description (str): Description of the event
     """
+    # Fixed attribute set: no per-instance __dict__ on ports that honour __slots__
+    __slots__ = ('event_name', 'start_time', 'end_time', 'speaker_name', 'description',
+                 '_start_str', '_end_str')
+
     def __init__(self, event_name, start_time, end_time, speaker_name, description):
         self.event_name = event_name
         self.start_time = start_time  # Epoch time
         self.end_time = end_time      # Epoch time
         self.speaker_name = speaker_name
         self.description = description
+        self._start_str = None        # Formatted start time, filled on first use
+        self._end_str = None          # Formatted end time, filled on first use
+
+    @property
+    def start_str(self):
+        """Start time formatted as YYYY-MM-DD HH:MM:SS (computed once)."""
+        if self._start_str is None:
+            self._start_str = format_timestamp(self.start_time)
+        return self._start_str
 
-def save_event_to_eeprom(event, address):
+    @property
+    def end_str(self):
+        """End time formatted as YYYY-MM-DD HH:MM:SS (computed once)."""
+        if self._end_str is None:
+            self._end_str = format_timestamp(self.end_time)
+        return self._end_str
+
+def format_timestamp(timestamp):
     """
-    Serialize and save an event to EEPROM at the specified address.
+    Format an Epoch timestamp as YYYY-MM-DD HH:MM:SS.
 
     Parameters:
-    - event (Event): Event object to save
-    - address (int): EEPROM address to start writing
+    - timestamp (int): Epoch time
+
+    Returns:
+    - str: Formatted date and time
     """
-    data = bytearray()
-    
-    # Serialize Event Name
+    return '{:04}-{:02}-{:02} {:02}:{:02}:{:02}'.format(*time.localtime(timestamp)[:6])
+
+# RAM directory of event slots: 1 if the slot may hold an event, 0 if it is
+# known to be empty. Built on first use from the first byte of every slot,
+# then kept current by save_event_to_eeprom and wipe_eeprom.
+slot_directory = None
+SLOT_PROBE_BUF = bytearray(1)  # Reusable buffer for one-byte slot probes
+
+def slot_is_empty(address):
+    """
+    Check with a single one-byte read whether the event slot at address is erased.
+
+    Parameters:
+    - address (int): EEPROM address of the event slot
+
+    Returns:
+    - bool: True if the slot's first byte is 0xFF (no event stored)
+    """
+    read_eeprom_into(address, SLOT_PROBE_BUF)
+    return SLOT_PROBE_BUF[0] == 0xFF
+
+def load_slot_directory():
+    """
+    Build the slot directory by reading the first byte (event name length) of each slot.
+
+    Returns:
+    - bytearray: One entry per slot, 1 if the slot may hold an event, 0 if empty
+    """
+    global slot_directory
+    directory = bytearray(NUM_SLOTS)
+    for slot in range(NUM_SLOTS):
+        read_eeprom_into(slot * EVENT_SIZE, SLOT_PROBE_BUF)
+        if 0 < SLOT_PROBE_BUF[0] <= 50:
+            directory[slot] = 1
+    slot_directory = directory
+    return directory
+
+def mark_slot(address, used):
+    """
+    Record in the slot directory whether the event slot at address is in use.
+
+    Parameters:
+    - address (int): EEPROM address of the event slot
+    - used (bool): True if the slot now holds an event
+    """
+    if slot_directory is not None and address % EVENT_SIZE == 0:
+        slot_directory[address // EVENT_SIZE] = 1 if used else 0
+
+def event_record(event, max_size=EVENT_SIZE):
+    """
+    Validate an event and describe its EEPROM record for struct packing.
+
+    Parameters:
+    - event (Event): Event object to serialize
+    - max_size (int): Largest record that fits the slot being written
+
+    Returns:
+    - tuple: (fmt, fields) to pass to struct.pack or struct.pack_into
+    - None: if a field or the whole record is too long
+    """
+    # Encode and check the string fields
     event_name_bytes = event.event_name.encode('utf-8')
     if len(event_name_bytes) > 50:
         print("Event name too long! Maximum 50 bytes allowed.")
-        return
-    data.append(len(event_name_bytes))
-    data.extend(event_name_bytes)
-    
-    # Serialize Start Time (4 bytes)
-    data.extend(event.start_time.to_bytes(4, 'big'))
-    
-    # Serialize End Time (4 bytes)
-    data.extend(event.end_time.to_bytes(4, 'big'))
-    
-    # Serialize Speaker Name
+        return None
     speaker_name_bytes = event.speaker_name.encode('utf-8')
     if len(speaker_name_bytes) > 50:
         print("Speaker name too long! Maximum 50 bytes allowed.")
-        return
-    data.append(len(speaker_name_bytes))
-    data.extend(speaker_name_bytes)
-    
-    # Serialize Description
+        return None
     description_bytes = event.description.encode('utf-8')
     if len(description_bytes) > 138:
         print("Description too long! Maximum 138 bytes allowed.")
-        return
-    data.extend(len(description_bytes).to_bytes(2, 'big'))
-    data.extend(description_bytes)
+        return None
+    
+    # name length (1), name, start time (4), end time (4),
+    # speaker length (1), speaker, description length (2), description
+    fmt = EVENT_BYTE_ORDER + 'B%dsIIB%dsH%ds' % (len(event_name_bytes), len(speaker_name_bytes), len(description_bytes))
+    
+    # Ensure total data length does not exceed the slot
+    size = struct.calcsize(fmt)
+    if size > max_size:
+        print(f"Serialized event size {size} exceeds {max_size} bytes. Cannot save.")
+        return None
     
-    # Ensure total data length does not exceed 250 bytes
-    if len(data) > 250:
-        print(f"Serialized event size {len(data)} exceeds 250 bytes. Cannot save.")
+    fields = (len(event_name_bytes), event_name_bytes,
+              event.start_time, event.end_time,
+              len(speaker_name_bytes), speaker_name_bytes,
+              len(description_bytes), description_bytes)
+    return fmt, fields
+
+def save_event_to_eeprom(event, address, verify=None):
+    """
+    Serialize and save an event to EEPROM at the specified address.
+
+    Parameters:
+    - event (Event): Event object to save
+    - address (int): EEPROM address to start writing
+    - verify (bool): Read the data back and compare it after writing
+      (defaults to DEBUG, so it is off unless debugging)
+    """
+    record = event_record(event)
+    if record is None:
         return
     
+    # Serialize the whole record in one allocation
+    fmt, fields = record
+    data = struct.pack(fmt, *fields)
+    
     # Write serialized data to EEPROM
     write_bytes_to_eeprom(address, data)
+    mark_slot(address, True)
     print("Event saved successfully.")
     
     # Optional Verification: Read back the written data to confirm
-    verification_data = read_bytes_from_eeprom(address, len(data))
-    if verification_data == data:
-        print("Verification Successful: Data written correctly.")
+    if verify is None:
+        verify = DEBUG
+    if verify:
+        verification_data = read_bytes_from_eeprom(address, len(data))
+        if verification_data == data:
+            print("Verification Successful: Data written correctly.")
+        else:
+            print("Verification Failed: Data mismatch.")
+
+def save_events_batch(events, start_address=0, slot_size=EVENT_SIZE):
+    """
+    Serialize a list of events into consecutive slots and write them in one pass.
+
+    The slots are packed into a single 0xFF-filled buffer, so the EEPROM is
+    written page by page in one call instead of once per event. Use
+    save_event_to_eeprom for one-off updates.
+
+    Parameters:
+    - events (list): Event objects to save, one per slot
+    - start_address (int): EEPROM address of the first slot
+    - slot_size (int): Size allocated for each event in EEPROM
+
+    Returns:
+    - bool: True if all events were written, False otherwise
+    """
+    global slot_directory
+    end_address = start_address + len(events) * slot_size
+    if end_address > EEPROM_SIZE:
+        print(f"{len(events)} events from address {start_address} do not fit in the EEPROM. Cannot save.")
+        return False
+    
+    # Unused bytes keep the erased (0xFF) state
+    buf = bytearray(b'\xff' * (end_address - start_address))
+    for i, event in enumerate(events):
+        # Each record must fit its own slot, or it would run into the next one
+        record = event_record(event, min(slot_size, EVENT_SIZE))
+        if record is None:
+            print(f"Event {i + 1} is invalid. Nothing was saved.")
+            return False
+        fmt, fields = record
+        struct.pack_into(fmt, buf, i * slot_size, *fields)
+    
+    write_bytes_to_eeprom(start_address, buf)
+    if slot_size == EVENT_SIZE and start_address % EVENT_SIZE == 0:
+        for i in range(len(events)):
+            mark_slot(start_address + i * slot_size, True)
     else:
-        print("Verification Failed: Data mismatch.")
+        # Non-standard slots can overwrite standard ones: rebuild the directory on next use
+        slot_directory = None
+    print(f"{len(events)} events saved successfully.")
+    return True
+
+def decode_field(data, start, length, field):
+    """
+    Decode a UTF-8 string field from an event record read out of EEPROM.
+
+    Parameters:
+    - data (memoryview): The whole event record
+    - start (int): Offset of the field within the record
+    - length (int): Length of the field in bytes
+    - field (str): Field name used in error messages
+
+    Returns:
+    - str: Decoded string
+    - None: if the field is truncated or not valid UTF-8
+    """
+    if start + length > len(data):
+        print(f"Invalid {field}: record truncated at offset {start}. Skipping event.")
+        return None
+    try:
+        # Decoding straight from the memoryview slice avoids copying the bytes first
+        return str(data[start:start + length], 'utf-8')
+    except ValueError as e:
+        print(f"Invalid {field}: failed to decode string from EEPROM: {e}. Skipping event.")
+        return None
 
 def load_event_from_eeprom(address):
     """
     Load and deserialize an event from EEPROM starting at the specified address.
 
+    The whole event slot is fetched in one I2C read and parsed in memory.
+
     Parameters:
     - address (int): EEPROM address to start reading
 
@@ -499,15 +792,18 @@ def load_event_from_eeprom(address):
     - Event: Deserialized Event object
     - None: if loading fails or no valid event found
     """
-    print(f"Loading event from EEPROM address {address}")
+    if DEBUG:
+        print(f"Loading event from EEPROM address {address}")
     
-    # Read Event Name Length
-    event_name_length_bytes = read_bytes_from_eeprom(address, 1)
-    if event_name_length_bytes is None:
-        print("Failed to read event name length.")
-        return None
-    event_name_length = event_name_length_bytes[0]
-    print(f"Event Name Length: {event_name_length}")
+    # Read into the shared EVENT_BUF and parse through a memoryview, so loading
+    # an event allocates nothing but the decoded strings
+    data = memoryview(EVENT_BUF)[:min(EVENT_SIZE, EEPROM_SIZE - address)]
+    read_eeprom_into(address, data)
+    
+    # Event Name Length
+    event_name_length = data[0]
+    if DEBUG:
+        print(f"Event Name Length: {event_name_length}")
     
     # Check if the entire event slot is empty (all bytes set to 0xFF)
     if event_name_length == 0xFF:
@@ -518,88 +814,71 @@ def load_event_from_eeprom(address):
     if event_name_length == 0 or event_name_length > 50:
         print(f"Invalid event name length ({event_name_length}) at address {address}. Skipping.")
         return None
-    address += 1
+    offset = 1
     
-    # Read Event Name
-    event_name = read_string_from_eeprom(address, event_name_length)
+    # Event Name
+    event_name = decode_field(data, offset, event_name_length, "event name")
     if event_name is None:
-        print(f"Invalid event name at address {address}. Skipping event.")
-        return None
-    address += event_name_length
-    
-    # Read Start Time
-    start_time_bytes = read_bytes_from_eeprom(address, 4)
-    if start_time_bytes is None or len(start_time_bytes) != 4:
-        print("Failed to read start time.")
-        return None
-    start_time = int.from_bytes(start_time_bytes, 'big')
-    print(f"Start Time (Epoch): {start_time}")
-    address += 4
-    
-    # Read End Time
-    end_time_bytes = read_bytes_from_eeprom(address, 4)
-    if end_time_bytes is None or len(end_time_bytes) != 4:
-        print("Failed to read end time.")
         return None
-    end_time = int.from_bytes(end_time_bytes, 'big')
-    print(f"End Time (Epoch): {end_time}")
-    address += 4
+    offset += event_name_length
     
-    # Read Speaker Name Length
-    speaker_name_length_bytes = read_bytes_from_eeprom(address, 1)
-    if speaker_name_length_bytes is None:
-        print("Failed to read speaker name length.")
+    # Start Time, End Time and Speaker Name Length
+    if offset + 9 > len(data):
+        print("Failed to read event times.")
         return None
-    speaker_name_length = speaker_name_length_bytes[0]
-    print(f"Speaker Name Length: {speaker_name_length}")
+    # Unpack all three fixed-size fields in one call, mirroring the struct.pack in save_event_to_eeprom
+    start_time, end_time, speaker_name_length = struct.unpack_from(EVENT_TIMES_FORMAT, data, offset)
+    if DEBUG:
+        print(f"Start Time (Epoch): {start_time}")
+        print(f"End Time (Epoch): {end_time}")
+        print(f"Speaker Name Length: {speaker_name_length}")
+    offset += 8
     
     # Check if the speaker name field is entirely empty
     if speaker_name_length == 0xFF:
-        print(f"Speaker name field at address {address} is empty.")
+        print(f"Speaker name field at address {address + offset} is empty.")
         return None
     
     # Validate speaker_name_length
     if speaker_name_length == 0 or speaker_name_length > 50:
-        print(f"Invalid speaker name length ({speaker_name_length}) at address {address}. Skipping.")
+        print(f"Invalid speaker name length ({speaker_name_length}) at address {address + offset}. Skipping.")
         return None
-    address += 1
+    offset += 1
     
-    # Read Speaker Name
-    speaker_name = read_string_from_eeprom(address, speaker_name_length)
+    # Speaker Name
+    speaker_name = decode_field(data, offset, speaker_name_length, "speaker name")
     if speaker_name is None:
-        print(f"Invalid speaker name at address {address}. Skipping event.")
         return None
-    address += speaker_name_length
+    offset += speaker_name_length
     
-    # Read Description Length
-    description_length_bytes = read_bytes_from_eeprom(address, 2)
-    if description_length_bytes is None or len(description_length_bytes) != 2:
+    # Description Length
+    if offset + 2 > len(data):
         print("Failed to read description length.")
         return None
-    description_length = int.from_bytes(description_length_bytes, 'big')
-    print(f"Description Length: {description_length}")
+    description_length = struct.unpack_from(EVENT_DESC_LEN_FORMAT, data, offset)[0]
+    if DEBUG:
+        print(f"Description Length: {description_length}")
     
     # Check if the description field is entirely empty
     if description_length == 0xFFFF:
-        print(f"Description field at address {address} is empty.")
+        print(f"Description field at address {address + offset} is empty.")
         return None
     
     # Validate description_length
     if description_length == 0 or description_length > 138:
-        print(f"Invalid description length ({description_length}) at address {address}. Skipping.")
+        print(f"Invalid description length ({description_length}) at address {address + offset}. Skipping.")
         return None
-    address += 2
+    offset += 2
     
-    # Read Description
-    description = read_string_from_eeprom(address, description_length)
+    # Description
+    description = decode_field(data, offset, description_length, "description")
     if description is None:
-        print(f"Invalid description at address {address}. Skipping event.")
         return None
-    address += description_length
     
     # Create Event Object
     event = Event(event_name, start_time, end_time, speaker_name, description)
-    print("Event loaded successfully.")
+    if DEBUG:
+        print("Event loaded successfully.")
     return event
 
 def list_all_events(start_address=0, max_events=10, event_size=250):
@@ -612,19 +891,27 @@ def list_all_events(start_address=0, max_events=10, event_size=250):
     - event_size (int): Size allocated for each event in EEPROM
     """
     print("\nListing All Events:")
+    # The slot directory only describes the standard slot layout
+    use_directory = event_size == EVENT_SIZE and start_address % EVENT_SIZE == 0
+    directory = (slot_directory or load_slot_directory()) if use_directory else None
     for i in range(max_events):
         addr = start_address + i * event_size
-        print(f"\nChecking Event {i + 1} at EEPROM address {addr}:")
-        event = load_event_from_eeprom(addr)
+        if DEBUG:
+            print(f"\nChecking Event {i + 1} at EEPROM address {addr}:")
+        # Skip the EEPROM read entirely for slots known to be empty
+        slot = addr // EVENT_SIZE
+        if directory is not None and slot < NUM_SLOTS:
+            event = load_event_from_eeprom(addr) if directory[slot] else None
+        # Without a directory entry, probe one byte before reading the whole slot
+        elif slot_is_empty(addr):
+            event = None
+        else:
+            event = load_event_from_eeprom(addr)
         if event:
             print(f"  Event {i + 1}:")
             print(f"    Name: {event.event_name}")
-            start_tuple = time.localtime(event.start_time)
-            print(f"    Start Time: {start_tuple[0]}-{start_tuple[1]:02}-{start_tuple[2]:02} "
-                  f"{start_tuple[3]:02}:{start_tuple[4]:02}:{start_tuple[5]:02}")
-            end_tuple = time.localtime(event.end_time)
-            print(f"    End Time: {end_tuple[0]}-{end_tuple[1]:02}-{end_tuple[2]:02} "
-                  f"{end_tuple[3]:02}:{end_tuple[4]:02}:{end_tuple[5]:02}")
+            print(f"    Start Time: {event.start_str}")
+            print(f"    End Time: {event.end_str}")
             print(f"    Speaker: {event.speaker_name}")
             print(f"    Description: {event.description}")
         else:
@@ -650,12 +937,15 @@ def scan_i2c_bus():
 # EEPROM Management Functions
 # ======================================
 
-def wipe_eeprom():
+def wipe_eeprom(verify=True):
     """
     Erase all data in the EEPROM with user confirmation and verification.
+
+    Parameters:
+    - verify (bool): Read back sampled pages after wiping to confirm
     """
     print("\n*** WARNING: This will erase all data in the EEPROM! ***")
-    confirmation = input("Are you sure you want to wipe the EEPROM? (yes/no): ").strip().lower()
+    confirmation = read_line("Are you sure you want to wipe the EEPROM? (yes/no): ").strip().lower()
     if confirmation not in ['yes', 'y']:
         print("EEPROM wipe canceled.")
         return
@@ -665,24 +955,37 @@ def wipe_eeprom():
     for addr in range(0, EEPROM_SIZE, PAGE_SIZE):
         remaining = EEPROM_SIZE - addr
         chunk_size = PAGE_SIZE if remaining >= PAGE_SIZE else remaining
-        # Create a chunk filled with 0xFF (common erased state)
-        chunk = bytearray([0xFF] * chunk_size)
+        # Erased state is all 0xFF; reuse the shared page instead of building one
+        chunk = ERASED_PAGE if chunk_size == PAGE_SIZE else ERASED_PAGE[:chunk_size]
+        # Skip pages that are already erased, saving the write cycle and wear;
+        # read into the shared page buffer rather than allocating per page
+        buf = PAGE_BUF if chunk_size == PAGE_SIZE else bytearray(chunk_size)
+        read_eeprom_into(addr, buf)
+        if buf == chunk:
+            continue
         try:
             write_bytes_to_eeprom(addr, chunk)
-            print(f"  Wiped {addr} to {addr + chunk_size - 1}")
+            if DEBUG:
+                print(f"  Wiped {addr} to {addr + chunk_size - 1}")
         except Exception as e:
             print(f"Failed to wipe EEPROM at address {addr}: {e}")
             return
     
     print("EEPROM wiped successfully.")
+    # Every slot is empty now
+    if slot_directory is not None:
+        slot_directory[:] = bytes(NUM_SLOTS)
+    
+    if not verify:
+        return
     
-    # Verification Step: Read back the first few bytes to confirm
-    verification_addresses = [0, 250, 500, 750, 1000, 1250, 1500, 1750, 2000, 2250, 2500, 2750, 3000, 3250, 3500, 3750, 4000]
+    # Verification Step: Read back one whole page every 512 bytes to confirm,
+    # a burst read per sample instead of a transaction per byte
     all_wiped = True
-    for v_addr in verification_addresses:
-        data = read_bytes_from_eeprom(v_addr, 1)
-        if data != b'\xFF':
-            print(f"Verification Failed: Address {v_addr} contains {data.hex()} instead of FF.")
+    for v_addr in range(0, EEPROM_SIZE, 512):
+        read_eeprom_into(v_addr, PAGE_BUF)
+        if PAGE_BUF != ERASED_PAGE:
+            print(f"Verification Failed: Page at address {v_addr} is not all FF.")
             all_wiped = False
     if all_wiped:
         print("Verification Successful: All checked addresses are wiped.")
@@ -693,6 +996,257 @@ def wipe_eeprom():
 # Interactive Menu Functions
 # ======================================
 
+# Called repeatedly while a prompt waits for console input, so other work
+# (e.g. refreshing a display) keeps running. Set with main(idle=...).
+input_idle = None
+INPUT_IDLE_MS = 20          # How often input_idle runs while waiting
+
+# True after a line ended in '\r', so the '\n' of a CRLF ending is skipped
+# instead of ending the next line as an empty one
+skip_line_feed = False
+
+stdin_poller = select.poll()
+stdin_poller.register(sys.stdin, select.POLLIN)
+
+def read_line(prompt=""):
+    """
+    Read a line from the console, like input(), but without blocking other work.
+
+    While no character is waiting, input_idle is called every INPUT_IDLE_MS.
+    Without an input_idle hook this is plain input().
+
+    Parameters:
+    - prompt (str): Text written before reading
+
+    Returns:
+    - str: The line entered, without the line ending
+
+    Raises:
+    - EOFError: if the console is closed
+    """
+    global skip_line_feed
+    if input_idle is None:
+        return input(prompt)
+    sys.stdout.write(prompt)
+    chars = []
+    while True:
+        if not stdin_poller.poll(INPUT_IDLE_MS):
+            input_idle()
+            continue
+        ch = sys.stdin.read(1)
+        if not ch:
+            raise EOFError
+        if skip_line_feed:
+            skip_line_feed = False
+            if ch == '\n':
+                continue
+        if ch in '\r\n':
+            skip_line_feed = ch == '\r'
+            sys.stdout.write('\n')
+            return ''.join(chars)
+        if ch in '\x08\x7f':
+            # Backspace: drop the last character and erase it on screen
+            if chars:
+                chars.pop()
+                sys.stdout.write('\b \b')
+            continue
+        chars.append(ch)
+        sys.stdout.write(ch)  # Echo, as input() would
+
+def parse_datetime(text):
+    """
+    Parse a "YYYY-MM-DD HH:MM:SS" string.
+
+    Parameters:
+    - text (str): Date and time entered by the user
+
+    Returns:
+    - tuple: (year, month, date, hour, minute, second)
+
+    Raises:
+    - ValueError: if the string is not in that format or a field is out of range
+    """
+    parts = text.strip().split()
+    if len(parts) != 2:
+        raise ValueError("expected YYYY-MM-DD HH:MM:SS")
+    ymd = parts[0].split('-')
+    hms = parts[1].split(':')
+    if len(ymd) != 3 or len(hms) != 3:
+        raise ValueError("expected YYYY-MM-DD HH:MM:SS")
+    year, month, date = [int(x) for x in ymd]
+    hour, minute, second = [int(x) for x in hms]
+    # time.mktime() would silently normalize these, and set_time() cannot encode them
+    if not (1 <= month <= 12 and 1 <= date <= 31 and 0 <= hour <= 23
+            and 0 <= minute <= 59 and 0 <= second <= 59):
+        raise ValueError("date or time field out of range")
+    return year, month, date, hour, minute, second
+
+def prompt_datetime(label):
+    """
+    Prompt for a date and time as a single "YYYY-MM-DD HH:MM:SS" line.
+
+    Parameters:
+    - label (str): Field name used in the prompt
+
+    Returns:
+    - tuple: (year, month, date, hour, minute, second)
+
+    Raises:
+    - ValueError: if the input is not in that format
+    """
+    return parse_datetime(read_line(f"{label} (YYYY-MM-DD HH:MM:SS): "))
+
+def prompt_epoch(label):
+    """
+    Prompt for a date and time and convert it to Epoch time.
+
+    Parameters:
+    - label (str): Field name used in the prompt
+
+    Returns:
+    - int: Epoch time
+
+    Raises:
+    - ValueError: if the input is not in "YYYY-MM-DD HH:MM:SS" format
+    """
+    year, month, date, hour, minute, second = prompt_datetime(label)
+    return int(time.mktime((year, month, date, hour, minute, second, 0, 0)))
+
+def prompt_bounded_str(label, max_bytes):
+    """
+    Prompt for a string that must fit in max_bytes once UTF-8 encoded.
+
+    Parameters:
+    - label (str): Field name used in the prompt and error message
+    - max_bytes (int): Maximum encoded length in bytes
+
+    Returns:
+    - str: The entered string
+    - None: if it is too long
+    """
+    value = read_line(f"Enter {label.lower()} (Max {max_bytes} characters): ")
+    if len(value.encode('utf-8')) > max_bytes:
+        print(f"{label} too long! Maximum {max_bytes} bytes allowed.")
+        return None
+    return value
+
+def read_slot_address(action):
+    """
+    Prompt for an EEPROM event address and check it.
+
+    Parameters:
+    - action (str): Text describing the operation, used in the prompt
+
+    Returns:
+    - int: The address
+    - None: if it is out of range or not a multiple of EVENT_SIZE
+    """
+    address = int(read_line(f"Enter EEPROM address to {action} (0-4095): "))
+    if address < 0 or address > 4095:
+        print("Invalid EEPROM address. Must be between 0 and 4095.")
+        return None
+
+    # Check if address is aligned with event_size (250 bytes)
+    if address % 250 != 0:
+        print("Please enter an address that is a multiple of 250 (e.g., 0, 250, 500, ...).")
+        return None
+    return address
+
+def handle_set_time():
+    """
+    Menu option 1: prompt for the date and time and write them to the RTC.
+    """
+    try:
+        year, month, date, hour, minute, second = prompt_datetime("Enter date and time")
+        # The weekday follows from the date; localtime() counts from Monday = 0
+        day = time.localtime(time.mktime((year, month, date, hour, minute, second, 0, 0)))[6] + 1
+        set_time(year, month, date, day, hour, minute, second)
+    except ValueError:
+        print("Invalid input. Please use the format YYYY-MM-DD HH:MM:SS.")
+
+def handle_read_time():
+    """
+    Menu option 2: print the current RTC time.
+    """
+    year, month, date, day, hour, minute, second = read_time()
+    print("Current time: {:04}-{:02}-{:02} {:02}:{:02}:{:02}".format(
+        year, month, date, hour, minute, second))
+
+def handle_read_temperature():
+    """
+    Menu option 3: print the RTC temperature.
+    """
+    print("Temperature: {:.2f}°C".format(read_temperature()))
+
+def handle_write_event():
+    """
+    Menu option 4: prompt for an event and save it to EEPROM.
+    """
+    try:
+        event_name = prompt_bounded_str("Event name", 50)
+        if event_name is None:
+            return
+
+        start_time = prompt_epoch("Enter event start time")
+        end_time = prompt_epoch("Enter event end time")
+
+        speaker_name = prompt_bounded_str("Speaker name", 50)
+        if speaker_name is None:
+            return
+
+        description = prompt_bounded_str("Description", 138)
+        if description is None:
+            return
+
+        event = Event(event_name, start_time, end_time, speaker_name, description)
+
+        address = read_slot_address("save the event")
+        if address is None:
+            return
+
+        save_event_to_eeprom(event, address)
+    except ValueError:
+        print("Invalid input. Please enter dates as YYYY-MM-DD HH:MM:SS and numbers where required.")
+    except Exception as e:
+        print("Error:", e)
+
+def handle_read_event():
+    """
+    Menu option 5: load an event from EEPROM and print it.
+    """
+    try:
+        address = read_slot_address("read the event from")
+        if address is None:
+            return
+
+        event = load_event_from_eeprom(address)
+        if event:
+            print("\nEvent Details:")
+            print("Event Name:", event.event_name)
+            print("Start Time:", event.start_str)
+            print("End Time:", event.end_str)
+            print("Speaker Name:", event.speaker_name)
+            print("Description:", event.description)
+        else:
+            print(f"No valid event found at EEPROM address {address}.")
+    except ValueError:
+        print("Invalid input. Please enter numerical values.")
+    except Exception as e:
+        print("Error:", e)
+
+# Menu choice -> handler. None marks the exit choice.
+MENU_ACTIONS = {
+    '1': handle_set_time,
+    '2': handle_read_time,
+    '3': handle_read_temperature,
+    '4': handle_write_event,
+    '5': handle_read_event,
+    '6': scan_i2c_bus,
+    '7': list_all_events,
+    '8': wipe_eeprom,
+    '9': None,
+}
+
 def print_menu():
     """
     Display the interactive menu to the user.
@@ -708,159 +1262,37 @@ def print_menu():
     print("8. Wipe EEPROM")
     print("9. Exit")
 
-def main():
+def main(idle=None):
     """
     Main loop to interact with the user through the interactive menu.
+
+    Parameters:
+    - idle (callable): Optional function called while waiting for input,
+      so it keeps running during prompts
     """
+    global input_idle
+    input_idle = idle
     while True:
         print_menu()
         try:
-            choice = input("Enter your choice: ").strip()
+            choice = read_line("Enter your choice: ").strip()
         except (EOFError, KeyboardInterrupt):
             print("\nExiting...")
             sys.exit()
 
-        if choice == '1':
-            # Set Time
-            try:
-                year = int(input("Enter year (YYYY): "))
-                month = int(input("Enter month (1-12): "))
-                date = int(input("Enter date (1-31): "))
-                day = int(input("Enter day of week (1-7, Mon=1): "))
-                hour = int(input("Enter hour (0-23): "))
-                minute = int(input("Enter minute (0-59): "))
-                second = int(input("Enter second (0-59): "))
-                set_time(year, month, date, day, hour, minute, second)
-            except ValueError:
-                print("Invalid input. Please enter numerical values.")
-        
-        elif choice == '2':
-            # Read Time
-            try:
-                time_data = read_time()
-                if time_data:
-                    year, month, date, day, hour, minute, second = time_data
-                    print("Current time: {:04}-{:02}-{:02} {:02}:{:02}:{:02}".format(
-                        year, month, date, hour, minute, second))
-            except Exception as e:
-                print("Error:", e)
-        
-        elif choice == '3':
-            # Read Temperature
-            try:
-                temp = read_temperature()
-                if temp is not None:
-                    print("Temperature: {:.2f}°C".format(temp))
-            except Exception as e:
-                print("Error:", e)
-        
-        elif choice == '4':
-            # Write Event to EEPROM
-            try:
-                event_name = input("Enter event name (Max 50 characters): ")
-                if len(event_name.encode('utf-8')) > 50:
-                    print("Event name too long! Maximum 50 bytes allowed.")
-                    continue
-
-                print("Enter event start time:")
-                start_year = int(input("  Year (YYYY): "))
-                start_month = int(input("  Month (1-12): "))
-                start_date = int(input("  Date (1-31): "))
-                start_hour = int(input("  Hour (0-23): "))
-                start_minute = int(input("  Minute (0-59): "))
-                start_second = int(input("  Second (0-59): "))
-                start_tuple = (start_year, start_month, start_date, start_hour, start_minute, start_second, 0, 0)
-                start_time = int(time.mktime(start_tuple))
-                
-                print("Enter event end time:")
-                end_year = int(input("  Year (YYYY): "))
-                end_month = int(input("  Month (1-12): "))
-                end_date = int(input("  Date (1-31): "))
-                end_hour = int(input("  Hour (0-23): "))
-                end_minute = int(input("  Minute (0-59): "))
-                end_second = int(input("  Second (0-59): "))
-                end_tuple = (end_year, end_month, end_date, end_hour, end_minute, end_second, 0, 0)
-                end_time = int(time.mktime(end_tuple))
-                
-                speaker_name = input("Enter speaker name (Max 50 characters): ")
-                if len(speaker_name.encode('utf-8')) > 50:
-                    print("Speaker name too long! Maximum 50 bytes allowed.")
-                    continue
-
-                description = input("Enter event description (Max 138 characters): ")
-                if len(description.encode('utf-8')) > 138:
-                    print("Description too long! Maximum 138 bytes allowed.")
-                    continue
-
-                event = Event(event_name, start_time, end_time, speaker_name, description)
-                
-                address = int(input("Enter EEPROM address to save the event (0-4095): "))
-                if address < 0 or address > 4095:
-                    print("Invalid EEPROM address. Must be between 0 and 4095.")
-                    continue
-                
-                # Check if address is aligned with event_size (250 bytes)
-                if address % 250 != 0:
-                    print("Please enter an address that is a multiple of 250 (e.g., 0, 250, 500, ...).")
-                    continue
-
-                save_event_to_eeprom(event, address)
-            except ValueError:
-                print("Invalid input. Please enter numerical values where required.")
-            except Exception as e:
-                print("Error:", e)
-        
-        elif choice == '5':
-            # Read Event from EEPROM
-            try:
-                address = int(input("Enter EEPROM address to read the event from (0-4095): "))
-                if address < 0 or address > 4095:
-                    print("Invalid EEPROM address. Must be between 0 and 4095.")
-                    continue
-                
-                # Check if address is aligned with event_size (250 bytes)
-                if address % 250 != 0:
-                    print("Please enter an address that is a multiple of 250 (e.g., 0, 250, 500, ...).")
-                    continue
-
-                event = load_event_from_eeprom(address)
-                if event:
-                    print("\nEvent Details:")
-                    print("Event Name:", event.event_name)
-                    start_tuple = time.localtime(event.start_time)
-                    print("Start Time: {:04}-{:02}-{:02} {:02}:{:02}:{:02}".format(
-                        start_tuple[0], start_tuple[1], start_tuple[2], start_tuple[3], start_tuple[4], start_tuple[5]))
-                    end_tuple = time.localtime(event.end_time)
-                    print("End Time: {:04}-{:02}-{:02} {:02}:{:02}:{:02}".format(
-                        end_tuple[0], end_tuple[1], end_tuple[2], end_tuple[3], end_tuple[4], end_tuple[5]))
-                    print("Speaker Name:", event.speaker_name)
-                    print("Description:", event.description)
-                else:
-                    print(f"No valid event found at EEPROM address {address}.")
-            except ValueError:
-                print("Invalid input. Please enter numerical values.")
-            except Exception as e:
-                print("Error:", e)
-        
-        elif choice == '6':
-            # Scan I2C Bus
-            scan_i2c_bus()
-        
-        elif choice == '7':
-            # List All Events
-            list_all_events()
-        
-        elif choice == '8':
-            # Wipe EEPROM
-            wipe_eeprom()
-        
-        elif choice == '9':
-            # Exit
+        if choice not in MENU_ACTIONS:
+            print("Invalid choice. Please try again.")
+            continue
+        action = MENU_ACTIONS[choice]
+        if action is None:
             print("Exiting...")
             break
-        
-        else:
-            print("Invalid choice. Please try again.")
+
+        # I2C helpers raise OSError instead of returning None; report it once here
+        try:
+            action()
+        except OSError as e:
+            print("I2C communication error:", e)
 
 # ======================================
 # Entry Point
@@ -17,8 +17,8 @@ Code Structure and Functionality
 Initialization from boot.py:
 
 I2C Configuration: Defines I2C addresses for various devices and initializes two I2C buses (i2c0 and i2c1).
-OLED Display: Sets up the OLED display using the ssd1306 library.
-Boot LED and Buttons: Initializes the boot LED and three buttons (buttonA, buttonB, buttonC) with pull-up resistors.
+OLED Display: Sets up the OLED display using the ssd1306 library, and pre-renders the fixed screen headers into framebuf buffers that are blitted onto each frame.
+Boot LED and Buttons: Initializes the boot LED and three buttons (buttonA, buttonB, buttonC) with pull-up resistors. Button presses are queued by pin interrupts (with debouncing) and read by the main loop with next_button().
 GPIOs: Sets up GPIO pins for each of the six ports, grouped for easier management.
 Petal SAO Initialization: Configures the Petal SAO if connected, handling its LED indicators.
 Touchwheel SAO Initialization: Detects and initializes the Touchwheel SAO on either I2C bus, setting up its RGB display.
@@ -29,15 +29,16 @@ DS3231 RTC Functions: Includes functions to set and read the current time and te
 EEPROM Read/Write Functions: Facilitates reading from and writing to the EEPROM, supporting string data storage with proper encoding and length checks.
 Event Class: Defines an Event class to encapsulate event details like name, timing, speaker, and description.
 Event Storage Functions: Allows serialization (save_event_to_eeprom) and deserialization (load_event_from_eeprom) of Event objects to/from EEPROM.
+EEPROM Management: wipe_eeprom erases the EEPROM one 32-byte page per write, or with fast=True only marks every event slot as empty.
 I2C Device Scanning and Display Functions:
 
-Device Mapping: Maintains dictionaries mapping I2C addresses to device names and additional information for both I2C buses.
+Device Mapping: DEVICES maps (address, bus) to a device's name and additional information where the same address means different SAOs on the two buses; DEFAULTS covers the rest by address. The information text is wrapped to the OLED width once at import.
 Device Scanning: Implements scan_devices to detect connected I2C devices, excluding certain addresses (e.g., OLED and EEPROM).
 Display Functions: Provides functions to display a list of detected devices (display_list) and detailed information about a selected device (display_details) on the OLED.
 Combining Functionalities:
 
 Display Modes: Defines different modes for the OLED display, including main menu, I2C detection, device detail view, and event display.
-User Interaction: The main function handles user input via buttons to navigate between modes, select options, and view details.
+User Interaction: The main function handles user input via buttons to navigate between modes, select options, and view details. Its state lives in a DisplayState object; RENDER maps each mode to the function that draws it, and BUTTON_ACTIONS maps each button and mode to the action it triggers.
 Event Display: Shows event details along with a countdown timer, indicating when the event will start or if it has already begun.
 Running the Main Function:
 
@@ -81,8 +82,10 @@ Adjust I2C addresses and GPIO pin assignments as necessary based on specific har
 
 
 from machine import I2C, Pin
+import struct
 import time
 import sys
+import framebuf
 import ssd1306
 
 # =========================
@@ -98,17 +101,68 @@ OLED_ADDRESS = 0x3C
 DS3231_I2C_ADDR = 0x68
 EEPROM_I2C_ADDR = 0x57  # Adjust based on your EEPROM's address pins
 
+# -------------------------
+# Debug Output
+# -------------------------
+# Development checks and diagnostic output (per-field load traces, write
+# read-back). Off by default: serial output costs more than the I2C reads.
+DEBUG = False
+
 # -------------------------
 # Initialize I2C Buses
 # -------------------------
-i2c0 = I2C(0, sda=Pin(0), scl=Pin(1), freq=400_000)
-i2c1 = I2C(1, sda=Pin(26), scl=Pin(27), freq=400_000)
+# The EEPROM and RTC share i2c0. Fast-mode Plus (1 MHz) speeds up EEPROM
+# transfers, but the DS3231 is only rated for 400 kHz, so it is opt-in and
+# only used if both devices answer at that speed. i2c1 carries the SAOs and
+# stays at 400 kHz.
+I2C_FREQ = 400_000
+I2C_FAST_FREQ = 1_000_000
+USE_FAST_I2C = False  # Set to True to try Fast-mode Plus on i2c0 first
+
+def init_i2c0():
+    """Initialize i2c0, at Fast-mode Plus if enabled and both calendar devices respond."""
+    if USE_FAST_I2C:
+        bus = I2C(0, sda=Pin(0), scl=Pin(1), freq=I2C_FAST_FREQ)
+        try:
+            bus.readfrom_mem(DS3231_I2C_ADDR, 0x00, 1)
+            bus.readfrom_mem(EEPROM_I2C_ADDR, 0, 1, addrsize=16)
+            return bus
+        except OSError:
+            print(f"i2c0 devices did not respond at {I2C_FAST_FREQ} Hz, falling back to {I2C_FREQ} Hz.")
+    return I2C(0, sda=Pin(0), scl=Pin(1), freq=I2C_FREQ)
+
+i2c0 = init_i2c0()
+i2c1 = I2C(1, sda=Pin(26), scl=Pin(27), freq=I2C_FREQ)
 
 # -------------------------
 # Initialize OLED Display
 # -------------------------
 display = ssd1306.SSD1306_I2C(128, 64, i2c0)
 
+def render_header(title):
+    """Draw a screen title and its underline once into a FrameBuffer for display.blit()."""
+    header = framebuf.FrameBuffer(bytearray(128 * 16 // 8), 128, 16, framebuf.MONO_VLSB)
+    header.text(title, 0, 0, 1)
+    header.line(0, 9, 127, 9, 1)
+    return header
+
+# Headers never change, so their glyphs are rendered here rather than on every redraw
+HEADER_MAIN_MENU = render_header("Main Menu:")
+HEADER_DEVICE_LIST = render_header("Super Add Ons:")
+
+# Control byte 0x00 (Co=0, D/C#=0) makes every following byte a command, so the
+# column and page window go out in one I2C write instead of one per command byte
+SHOW_PAGES_CMD = bytearray((0x00, 0x21, 0, display.width - 1, 0x22, 0, 0))
+
+def show_pages(first_page, last_page):
+    """Send only display pages first_page..last_page (8 pixel rows each) to the OLED."""
+    SHOW_PAGES_CMD[5] = first_page
+    SHOW_PAGES_CMD[6] = last_page
+    display.i2c.writeto(display.addr, SHOW_PAGES_CMD)
+    # The driver's write_data sends the 0x40 data prefix and the pixels in one writevto.
+    # In horizontal addressing mode each page is one display.width-byte run of the buffer.
+    display.write_data(memoryview(display.buffer)[first_page * display.width:(last_page + 1) * display.width])
+
 # -------------------------
 # Initialize Boot LED
 # -------------------------
@@ -122,6 +176,62 @@ buttonA = Pin(8, Pin.IN, Pin.PULL_UP)
 buttonB = Pin(9, Pin.IN, Pin.PULL_UP)
 buttonC = Pin(28, Pin.IN, Pin.PULL_UP)
 
+# -------------------------
+# Button Press Queue
+# -------------------------
+# Pin interrupts record presses in a small ring buffer that main() drains, so
+# the loop neither polls the buttons nor blocks in a debounce delay
+BUTTON_A = 1
+BUTTON_B = 2
+BUTTON_C = 3
+BUTTON_DEBOUNCE_MS = 200
+BUTTON_QUEUE_SIZE = 8           # Power of two, so indexes wrap with a mask
+BUTTON_POLL_MS = 20             # How often wait_for_button checks the queue
+button_queue = bytearray(BUTTON_QUEUE_SIZE)
+button_head = 0                 # Next slot written by the interrupt handler
+button_tail = 0                 # Next slot read by main()
+button_last_ms = [0, 0, 0, 0]   # Time of the last accepted press, by button id
+button_release_ms = [0, 0, 0, 0]  # Time of the last release edge, by button id
+
+def queue_button(button, pin):
+    """
+    Record a press of button (BUTTON_A/B/C). Called from the pin interrupt on both edges.
+    A press counts only if the pin is still low and it is not bounce from the last press
+    or from a release, so holding a button and letting go queues nothing extra.
+    """
+    global button_head
+    now = time.ticks_ms()
+    if pin.value():
+        button_release_ms[button] = now  # Released (or bouncing): later falling edges are bounce
+        return
+    if (time.ticks_diff(now, button_last_ms[button]) < BUTTON_DEBOUNCE_MS
+            or time.ticks_diff(now, button_release_ms[button]) < BUTTON_DEBOUNCE_MS):
+        return  # Contact bounce from the previous press or release
+    button_last_ms[button] = now
+    next_head = (button_head + 1) & (BUTTON_QUEUE_SIZE - 1)
+    if next_head != button_tail:  # Drop the press if the queue is full
+        button_queue[button_head] = button
+        button_head = next_head
+
+def next_button():
+    """Return the oldest queued button press, or 0 if none is waiting."""
+    global button_tail
+    if button_tail == button_head:
+        return 0
+    button = button_queue[button_tail]
+    button_tail = (button_tail + 1) & (BUTTON_QUEUE_SIZE - 1)
+    return button
+
+def wait_for_button(timeout_ms):
+    """Sleep until a button press is queued or timeout_ms has passed."""
+    deadline = time.ticks_add(time.ticks_ms(), timeout_ms)
+    while button_tail == button_head and time.ticks_diff(deadline, time.ticks_ms()) > 0:
+        time.sleep_ms(BUTTON_POLL_MS)
+
+buttonA.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=lambda pin: queue_button(BUTTON_A, pin))
+buttonB.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=lambda pin: queue_button(BUTTON_B, pin))
+buttonC.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=lambda pin: queue_button(BUTTON_C, pin))
+
 # -------------------------
 # Initialize GPIOs for Each Port
 # -------------------------
@@ -156,15 +266,20 @@ GPIOs = [
 # -------------------------
 # Petal SAO Initialization Function
 # -------------------------
+# Petal configuration registers 0x09-0x0F, sent in one auto-incrementing write
+PETAL_INIT_REGS = bytes([
+    0x00,  # 0x09: raw pixel mode (not 7-seg)
+    0x09,  # 0x0A: intensity (of 16)
+    0x07,  # 0x0B: enable all segments
+    0x81,  # 0x0C: undo shutdown bits
+    0x00,  # 0x0D
+    0x00,  # 0x0E: no crazy features (default?)
+    0x00,  # 0x0F: turn off display test mode
+])
+
 def petal_init(bus):
     """Configure the petal SAO."""
-    bus.writeto_mem(PETAL_ADDRESS, 0x09, bytes([0x00]))  # raw pixel mode (not 7-seg)
-    bus.writeto_mem(PETAL_ADDRESS, 0x0A, bytes([0x09]))  # intensity (of 16)
-    bus.writeto_mem(PETAL_ADDRESS, 0x0B, bytes([0x07]))  # enable all segments
-    bus.writeto_mem(PETAL_ADDRESS, 0x0C, bytes([0x81]))  # undo shutdown bits
-    bus.writeto_mem(PETAL_ADDRESS, 0x0D, bytes([0x00]))
-    bus.writeto_mem(PETAL_ADDRESS, 0x0E, bytes([0x00]))  # no crazy features (default?)
-    bus.writeto_mem(PETAL_ADDRESS, 0x0F, bytes([0x00]))  # turn off display test mode
+    bus.writeto_mem(PETAL_ADDRESS, 0x09, PETAL_INIT_REGS)
 
 # -------------------------
 # Initialize Petal SAO on Available I2C Bus
@@ -199,22 +314,31 @@ if petal_bus:
 # -------------------------
 # Initialize Touchwheel SAO
 # -------------------------
-touchwheel_bus = None
-touchwheel_counter = 0
-while not touchwheel_bus:
+def touchwheel_present(bus):
+    """Probe the touchwheel address directly; one address ACK costs far less than a full bus scan."""
     try:
-        # Scan i2c0 for touchwheel
-        if TOUCHWHEEL_ADDRESS in i2c0.scan():
-            touchwheel_bus = i2c0
-        # If not found, scan i2c1
-        elif TOUCHWHEEL_ADDRESS in i2c1.scan():
-            touchwheel_bus = i2c1
-    except:
-        pass
-    time.sleep_ms(100)
-    touchwheel_counter += 1
-    if touchwheel_counter > 50:
+        bus.writeto(TOUCHWHEEL_ADDRESS, b'')  # Address only, as scan() does, but for one device
+        return True
+    except OSError:
+        return False
+
+TOUCHWHEEL_TIMEOUT_MS = 5000  # Give up looking for the touchwheel after this long
+touchwheel_bus = None
+touchwheel_deadline = time.ticks_add(time.ticks_ms(), TOUCHWHEEL_TIMEOUT_MS)
+touchwheel_delay_ms = 50
+while True:
+    # Probe i2c0 for touchwheel, then i2c1
+    if touchwheel_present(i2c0):
+        touchwheel_bus = i2c0
         break
+    if touchwheel_present(i2c1):
+        touchwheel_bus = i2c1
+        break
+    if time.ticks_diff(touchwheel_deadline, time.ticks_ms()) <= 0:
+        break
+    # Back off between attempts so a missing touchwheel does not hammer the buses
+    time.sleep_ms(touchwheel_delay_ms)
+    touchwheel_delay_ms = min(touchwheel_delay_ms * 2, 800)
 
 if not touchwheel_bus:
     print("Warning: Touchwheel not found.")
@@ -228,9 +352,8 @@ def touchwheel_read(bus):
 
 def touchwheel_rgb(bus, r, g, b):
     """Set RGB color on the central display. Each value ranges from 0-255."""
-    bus.writeto_mem(TOUCHWHEEL_ADDRESS, 15, bytes([r]))
-    bus.writeto_mem(TOUCHWHEEL_ADDRESS, 16, bytes([g]))
-    bus.writeto_mem(TOUCHWHEEL_ADDRESS, 17, bytes([b]))
+    # Registers 15-17 are consecutive, so write all three in one transaction
+    bus.writeto_mem(TOUCHWHEEL_ADDRESS, 15, bytes((r, g, b)))
 
 # -------------------------
 # Enable Green LED if Wheel Configured
@@ -249,29 +372,34 @@ if petal_bus:
 # -------------------------
 # BCD Conversion Functions
 # -------------------------
+# Lookup tables built once so conversions are a single index operation
+DEC_TO_BCD = bytes((val // 10 << 4) + (val % 10) for val in range(100))
+BCD_TO_DEC = bytes(((val >> 4) * 10) + (val & 0x0F) for val in range(256))
+RTC_BUF = bytearray(7)  # Reusable buffer for the seven DS3231 timekeeping registers
+
 def dec_to_bcd(val):
-    """Convert decimal to Binary-Coded Decimal (BCD)."""
-    return (val // 10 << 4) + (val % 10)
+    """Convert decimal (0-99) to Binary-Coded Decimal (BCD)."""
+    return DEC_TO_BCD[val]
 
 def bcd_to_dec(val):
     """Convert Binary-Coded Decimal (BCD) to decimal."""
-    return ((val >> 4) * 10) + (val & 0x0F)
+    return BCD_TO_DEC[val]
 
 # -------------------------
 # DS3231 RTC Functions
 # -------------------------
 def set_time(year, month, date, day, hour, minute, second):
     """Set the DS3231 RTC time."""
-    year = year % 100  # Ensure two-digit year
-    data = bytes([
-        dec_to_bcd(second),
-        dec_to_bcd(minute),
-        dec_to_bcd(hour),
-        dec_to_bcd(day),
-        dec_to_bcd(date),
-        dec_to_bcd(month),
-        dec_to_bcd(year)
-    ])
+    # Registers 0x00-0x06 in order, written in one burst; the DS3231 keeps a two-digit year
+    data = bytes((
+        DEC_TO_BCD[second],
+        DEC_TO_BCD[minute],
+        DEC_TO_BCD[hour],
+        DEC_TO_BCD[day],
+        DEC_TO_BCD[date],
+        DEC_TO_BCD[month],
+        DEC_TO_BCD[year % 100]
+    ))
     try:
         i2c0.writeto_mem(DS3231_I2C_ADDR, 0x00, data)
         print("Time set successfully.")
@@ -281,14 +409,15 @@ def set_time(year, month, date, day, hour, minute, second):
 def read_time():
     """Read the current time from DS3231 RTC."""
     try:
-        data = i2c0.readfrom_mem(DS3231_I2C_ADDR, 0x00, 7)
-        second = bcd_to_dec(data[0])
-        minute = bcd_to_dec(data[1])
-        hour = bcd_to_dec(data[2])
-        day = bcd_to_dec(data[3])
-        date = bcd_to_dec(data[4])
-        month = bcd_to_dec(data[5] & 0x1F)
-        year = bcd_to_dec(data[6]) + 2000
+        data = RTC_BUF
+        i2c0.readfrom_mem_into(DS3231_I2C_ADDR, 0x00, data)
+        second = BCD_TO_DEC[data[0]]
+        minute = BCD_TO_DEC[data[1]]
+        hour = BCD_TO_DEC[data[2]]
+        day = BCD_TO_DEC[data[3]]
+        date = BCD_TO_DEC[data[4]]
+        month = BCD_TO_DEC[data[5] & 0x1F]
+        year = BCD_TO_DEC[data[6]] + 2000
         return (year, month, date, day, hour, minute, second)
     except OSError as e:
         print("Failed to read time:", e)
@@ -297,11 +426,12 @@ def read_time():
 def read_temperature():
     """Read the temperature from DS3231 RTC."""
     try:
-        temp_msb = i2c0.readfrom_mem(DS3231_I2C_ADDR, 0x11, 1)[0]
-        temp_lsb = i2c0.readfrom_mem(DS3231_I2C_ADDR, 0x12, 1)[0]
-        temp = temp_msb + ((temp_lsb >> 6) * 0.25)
-        print(f"Read Temperature: {temp:.2f}°C")
-        return temp
+        # MSB (0x11) and LSB (0x12) are consecutive, so read both at once
+        temp_msb, temp_lsb = i2c0.readfrom_mem(DS3231_I2C_ADDR, 0x11, 2)
+        # MSB is a two's complement integer part; convert for sub-zero values
+        if temp_msb & 0x80:
+            temp_msb -= 256
+        return temp_msb + ((temp_lsb >> 6) * 0.25)
     except OSError as e:
         print("Failed to read temperature:", e)
         return None
@@ -311,23 +441,44 @@ def read_temperature():
 # -------------------------
 EEPROM_SIZE = 4096  # 4KB EEPROM
 PAGE_SIZE = 32       # EEPROM page size
+EVENT_SIZE = 250     # Space allocated to each event in EEPROM
+EEPROM_WRITE_TIME_MS = 10  # Worst-case EEPROM page write cycle time
+EVENT_BUF = bytearray(EVENT_SIZE)  # Reusable buffer for whole-slot event reads
+ERASED_PAGE = b'\xff' * PAGE_SIZE  # One page in the erased (all 0xFF) state
+
+def wait_for_eeprom_write():
+    """
+    Wait for the EEPROM to finish its internal write cycle.
+    The EEPROM does not acknowledge its address while busy, so poll it until it does (ACK polling).
+    """
+    deadline = time.ticks_add(time.ticks_ms(), EEPROM_WRITE_TIME_MS)
+    while True:
+        try:
+            i2c0.writeto(EEPROM_I2C_ADDR, b'')
+            return
+        except OSError:
+            if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+                return
+            time.sleep_us(200)
 
 def write_bytes_to_eeprom(address, data):
     """
     Write bytes to EEPROM starting at the specified address.
     Utilizes writeto_mem with two-byte addressing for EEPROMs larger than 256 bytes.
     """
-    while data:
-        chunk = data[:PAGE_SIZE]
-        data = data[PAGE_SIZE:]
+    mv = memoryview(data)  # Page slices reference data instead of copying it
+    offset = 0
+    while offset < len(mv):
+        # Never cross a page boundary, or the EEPROM wraps around within the page
+        n = min(PAGE_SIZE - (address + offset) % PAGE_SIZE, len(mv) - offset)
         try:
             # Use writeto_mem with two-byte address by specifying addrsize=16
-            i2c0.writeto_mem(EEPROM_I2C_ADDR, address, chunk, addrsize=16)
-            time.sleep_ms(10)  # Increased delay to ensure EEPROM write cycle completes
-            address += len(chunk)
+            i2c0.writeto_mem(EEPROM_I2C_ADDR, address + offset, mv[offset:offset + n], addrsize=16)
+            wait_for_eeprom_write()  # Returns as soon as the write cycle completes
         except OSError as e:
             print("Failed to write to EEPROM:", e)
             break
+        offset += n
     print("Bytes written to EEPROM successfully.")
 
 def read_bytes_from_eeprom(address, length):
@@ -343,6 +494,18 @@ def read_bytes_from_eeprom(address, length):
         print("Failed to read from EEPROM:", e)
         return None
 
+def read_eeprom_into(address, buf):
+    """
+    Read len(buf) bytes from EEPROM into an existing buffer, without allocating.
+    Returns True on success, False if the I2C read fails.
+    """
+    try:
+        i2c0.readfrom_mem_into(EEPROM_I2C_ADDR, address, buf, addrsize=16)
+        return True
+    except OSError as e:
+        print("Failed to read from EEPROM:", e)
+        return False
+
 def write_string_to_eeprom(address, string):
     """Write a string to EEPROM at the specified address."""
     data = string.encode('utf-8')
@@ -368,53 +531,69 @@ def read_string_from_eeprom(address, length):
 # -------------------------
 class Event:
     """Class representing an event in the schedule."""
+    # Fixed attribute set: no per-instance __dict__ on ports that honour __slots__
+    __slots__ = ('event_name', 'start_time', 'end_time', 'speaker_name', 'description',
+                 '_detail_lines')
+
     def __init__(self, event_name, start_time, end_time, speaker_name, description):
         self.event_name = event_name
         self.start_time = start_time  # Epoch time
         self.end_time = end_time      # Epoch time
         self.speaker_name = speaker_name
         self.description = description
+        self._detail_lines = None     # OLED detail lines, filled on first use
+
+    @property
+    def detail_lines(self):
+        """Name, start, end, speaker and description lines for display_event (computed once)."""
+        if self._detail_lines is None:
+            # Convert start time and end time from epoch to struct_time
+            start_time_struct = time.localtime(self.start_time)
+            end_time_struct = time.localtime(self.end_time)
+            self._detail_lines = (
+                "Name: " + self.event_name,
+                "Start: {:02}:{:02}".format(start_time_struct[3], start_time_struct[4]),
+                "End: {:02}:{:02}".format(end_time_struct[3], end_time_struct[4]),
+                "Speaker: " + self.speaker_name,
+                "Desc: " + self.description[:20],  # Truncated if too long
+            )
+        return self._detail_lines
 
 # -------------------------
 # Event Storage Functions
 # -------------------------
-def save_event_to_eeprom(event, address):
-    """Serialize and save an event to EEPROM at the specified address."""
-    data = bytearray()
-    
-    # Event Name
+def save_event_to_eeprom(event, address, verify=None):
+    """
+    Serialize and save an event to EEPROM at the specified address.
+    Reads the record back to verify it if verify is True (defaults to DEBUG).
+    """
+    # Encode and check the string fields
     event_name_bytes = event.event_name.encode('utf-8')
     if len(event_name_bytes) > 50:
         print("Event name too long! Maximum 50 bytes allowed.")
         return
-    data.append(len(event_name_bytes))
-    data.extend(event_name_bytes)
-    
-    # Start Time (4 bytes)
-    data.extend(event.start_time.to_bytes(4, 'big'))
-    
-    # End Time (4 bytes)
-    data.extend(event.end_time.to_bytes(4, 'big'))
-    
-    # Speaker Name
     speaker_name_bytes = event.speaker_name.encode('utf-8')
     if len(speaker_name_bytes) > 50:
         print("Speaker name too long! Maximum 50 bytes allowed.")
         return
-    data.append(len(speaker_name_bytes))
-    data.extend(speaker_name_bytes)
-    
-    # Description
     description_bytes = event.description.encode('utf-8')
     if len(description_bytes) > 138:
         print("Description too long! Maximum 138 bytes allowed.")
         return
-    data.extend(len(description_bytes).to_bytes(2, 'big'))
-    data.extend(description_bytes)
+    
+    # Serialize the whole record in one allocation:
+    # name length (1), name, start time (4), end time (4),
+    # speaker length (1), speaker, description length (2), description
+    fmt = '>B%dsIIB%dsH%ds' % (len(event_name_bytes), len(speaker_name_bytes), len(description_bytes))
+    data = struct.pack(fmt,
+                       len(event_name_bytes), event_name_bytes,
+                       event.start_time, event.end_time,
+                       len(speaker_name_bytes), speaker_name_bytes,
+                       len(description_bytes), description_bytes)
     
     # Ensure total data length does not exceed 250 bytes
-    if len(data) > 250:
-        print(f"Serialized event size {len(data)} exceeds 250 bytes. Cannot save.")
+    if len(data) > EVENT_SIZE:
+        print(f"Serialized event size {len(data)} exceeds {EVENT_SIZE} bytes. Cannot save.")
         return
     
     # Write data to EEPROM
@@ -422,23 +601,42 @@ def save_event_to_eeprom(event, address):
     print("Event saved successfully.")
     
     # Optional Verification: Read back the written data to confirm
-    verification_data = read_bytes_from_eeprom(address, len(data))
-    if verification_data == data:
-        print("Verification Successful: Data written correctly.")
-    else:
-        print("Verification Failed: Data mismatch.")
+    if verify is None:
+        verify = DEBUG
+    if verify:
+        verification_data = read_bytes_from_eeprom(address, len(data))
+        if verification_data == data:
+            print("Verification Successful: Data written correctly.")
+        else:
+            print("Verification Failed: Data mismatch.")
+
+def decode_field(data, start, length, field):
+    """Decode a UTF-8 string field of an event record, or return None if it is truncated or invalid."""
+    if start + length > len(data):
+        print(f"Invalid {field}: record truncated at offset {start}. Skipping event.")
+        return None
+    try:
+        return str(data[start:start + length], 'utf-8')
+    except ValueError as e:
+        print(f"Invalid {field}: failed to decode string from EEPROM: {e}. Skipping event.")
+        return None
 
 def load_event_from_eeprom(address):
     """Load and deserialize an event from EEPROM starting at the specified address."""
-    print(f"Loading event from EEPROM address {address}")
+    if DEBUG:
+        print(f"Loading event from EEPROM address {address}")
     
-    # Read Event Name Length
-    event_name_length_bytes = read_bytes_from_eeprom(address, 1)
-    if event_name_length_bytes is None:
-        print("Failed to read event name length.")
+    # Read the whole event slot in one transaction into the shared EVENT_BUF and
+    # parse it through a memoryview, so only the decoded strings are allocated
+    data = memoryview(EVENT_BUF)[:min(EVENT_SIZE, EEPROM_SIZE - address)]
+    if not read_eeprom_into(address, data):
+        print("Failed to read event from EEPROM.")
         return None
-    event_name_length = event_name_length_bytes[0]
-    print(f"Event Name Length: {event_name_length}")
+    
+    # Event Name Length
+    event_name_length = data[0]
+    if DEBUG:
+        print(f"Event Name Length: {event_name_length}")
     
     # Check if the entire event slot is empty (all bytes set to 0xFF)
     if event_name_length == 0xFF:
@@ -449,138 +647,159 @@ def load_event_from_eeprom(address):
     if event_name_length == 0 or event_name_length > 50:
         print(f"Invalid event name length ({event_name_length}) at address {address}. Skipping.")
         return None
-    address += 1
+    offset = 1
     
-    # Read Event Name
-    event_name = read_string_from_eeprom(address, event_name_length)
+    # Event Name
+    event_name = decode_field(data, offset, event_name_length, "event name")
     if event_name is None:
-        print(f"Invalid event name at address {address}. Skipping event.")
         return None
-    address += event_name_length
+    offset += event_name_length
     
-    # Read Start Time
-    start_time_bytes = read_bytes_from_eeprom(address, 4)
-    if start_time_bytes is None or len(start_time_bytes) != 4:
-        print("Failed to read start time.")
+    # Start Time, End Time and Speaker Name Length
+    if offset + 9 > len(data):
+        print("Failed to read event times.")
         return None
-    start_time = int.from_bytes(start_time_bytes, 'big')
-    print(f"Start Time (Epoch): {start_time}")
-    address += 4
-    
-    # Read End Time
-    end_time_bytes = read_bytes_from_eeprom(address, 4)
-    if end_time_bytes is None or len(end_time_bytes) != 4:
-        print("Failed to read end time.")
-        return None
-    end_time = int.from_bytes(end_time_bytes, 'big')
-    print(f"End Time (Epoch): {end_time}")
-    address += 4
-    
-    # Read Speaker Name Length
-    speaker_name_length_bytes = read_bytes_from_eeprom(address, 1)
-    if speaker_name_length_bytes is None:
-        print("Failed to read speaker name length.")
-        return None
-    speaker_name_length = speaker_name_length_bytes[0]
-    print(f"Speaker Name Length: {speaker_name_length}")
+    # Unpack all three fixed-size fields in one call, mirroring the struct.pack in save_event_to_eeprom
+    start_time, end_time, speaker_name_length = struct.unpack_from('>IIB', data, offset)
+    if DEBUG:
+        print(f"Start Time (Epoch): {start_time}")
+        print(f"End Time (Epoch): {end_time}")
+        print(f"Speaker Name Length: {speaker_name_length}")
+    offset += 8
     
     # Check if the speaker name field is entirely empty
     if speaker_name_length == 0xFF:
-        print(f"Speaker name field at address {address} is empty.")
+        print(f"Speaker name field at address {address + offset} is empty.")
         return None
     
     # Validate speaker_name_length
     if speaker_name_length == 0 or speaker_name_length > 50:
-        print(f"Invalid speaker name length ({speaker_name_length}) at address {address}. Skipping.")
+        print(f"Invalid speaker name length ({speaker_name_length}) at address {address + offset}. Skipping.")
         return None
-    address += 1
+    offset += 1
     
-    # Read Speaker Name
-    speaker_name = read_string_from_eeprom(address, speaker_name_length)
+    # Speaker Name
+    speaker_name = decode_field(data, offset, speaker_name_length, "speaker name")
     if speaker_name is None:
-        print(f"Invalid speaker name at address {address}. Skipping event.")
         return None
-    address += speaker_name_length
+    offset += speaker_name_length
     
-    # Read Description Length
-    description_length_bytes = read_bytes_from_eeprom(address, 2)
-    if description_length_bytes is None or len(description_length_bytes) != 2:
+    # Description Length
+    if offset + 2 > len(data):
         print("Failed to read description length.")
         return None
-    description_length = int.from_bytes(description_length_bytes, 'big')
-    print(f"Description Length: {description_length}")
+    description_length = struct.unpack_from('>H', data, offset)[0]
+    if DEBUG:
+        print(f"Description Length: {description_length}")
     
     # Check if the description field is entirely empty
     if description_length == 0xFFFF:
-        print(f"Description field at address {address} is empty.")
+        print(f"Description field at address {address + offset} is empty.")
         return None
     
     # Validate description_length
     if description_length == 0 or description_length > 138:
-        print(f"Invalid description length ({description_length}) at address {address}. Skipping.")
+        print(f"Invalid description length ({description_length}) at address {address + offset}. Skipping.")
         return None
-    address += 2
+    offset += 2
     
-    # Read Description
-    description = read_string_from_eeprom(address, description_length)
+    # Description
+    description = decode_field(data, offset, description_length, "description")
     if description is None:
-        print(f"Invalid description at address {address}. Skipping event.")
         return None
-    address += description_length
     
     # Create event object
     event = Event(event_name, start_time, end_time, speaker_name, description)
-    print("Event loaded successfully.")
+    if DEBUG:
+        print("Event loaded successfully.")
     return event
 
+# -------------------------
+# EEPROM Management Functions
+# -------------------------
+def wipe_eeprom(fast=False):
+    """
+    Erase the EEPROM without user confirmation by filling it with 0xFF, one page per write.
+    With fast=True, only the first byte of each event slot is erased, which is enough
+    for load_event_from_eeprom to treat every slot as empty.
+    """
+    if fast:
+        for addr in range(0, EEPROM_SIZE, EVENT_SIZE):
+            write_bytes_to_eeprom(addr, ERASED_PAGE[:1])
+        print("EEPROM event slots cleared.")
+        return
+    print("Wiping EEPROM...")
+    for addr in range(0, EEPROM_SIZE, PAGE_SIZE):
+        remaining = EEPROM_SIZE - addr
+        # Reuse the shared erased page instead of allocating one per chunk
+        write_bytes_to_eeprom(addr, ERASED_PAGE if remaining >= PAGE_SIZE else ERASED_PAGE[:remaining])
+    print("EEPROM wiped successfully.")
+
 # =========================
 # I2C Device Scanning and Display Functions from boot.py
 # =========================
 
 # -------------------------
-# Device Names Mapping for Each I2C Bus
+# Device Names and Information
 # -------------------------
-device_names_i2c0 = {
-    0x54: "Touchwheel",
-    0x55: "BadgeTagNFC",
-    0x15: "Skull of Fate",
-    0x14: "Skull of Fate",
-    0x13: "Skull of Fate",
-    0x19: "Blinky Loop",
-    0x57: "Calendar"
+# (address, bus) -> (name, info) for addresses shared by different SAOs
+DEVICES = {
+    (0x19, "i2c0"): ("Blinky Loop", "Blinky Loop provides mesmerizing blinking patterns."),
+    (0x19, "i2c1"): ("Etch sAo Sketch", "Etch sAo Sketch is a digital drawing pad."),
 }
 
-device_names_i2c1 = {
-    0x54: "Touchwheel",
-    0x55: "BadgeTagNFC",
-    0x15: "Skull of Fate",
-    0x14: "Skull of Fate",
-    0x13: "Skull of Fate",
-    0x19: "Etch sAo Sketch",
-    0x57: "Calendar"
+# address -> (name, info) for devices that are the same on either bus
+DEFAULTS = {
+    0x54: ("Touchwheel", "TouchwheelSAO by @todbot github.com/todbot/TouchWheelSAO"),
+    0x55: ("BadgeTagNFC", "BadgeTagNFC is a versatile NFC badge."),
+    0x15: ("Skull of Fate", "Skull of Fate is a mystical artifact for determining one's fate."),
+    0x14: ("Skull of Fate", "Another variant of the Skull of Fate."),
+    0x13: ("Skull of Fate", "Yet another version of the Skull of Fate."),
+    0x57: ("Calendar", "This is a calendar"),
 }
 
 # -------------------------
 # Devices to Exclude from Display
 # -------------------------
-exclude_list = {
-    0x3C: "OLED Display",
-    0x68: "EEprom Calendar"
-}
+# Built once as a set so each scanned address is a single membership test
+EXCLUDE = frozenset((
+    OLED_ADDRESS,     # OLED Display
+    DS3231_I2C_ADDR,  # Calendar RTC
+))
 
 # -------------------------
-# Device Information Mapping
+# Device Lookup
 # -------------------------
-device_info = {
-    (0x19, "i2c0"): "Blinky Loop provides mesmerizing blinking patterns.",
-    (0x19, "i2c1"): "Etch sAo Sketch is a digital drawing pad.",
-    0x54: "TouchwheelSAO by @todbot github.com/todbot/TouchWheelSAO",
-    0x55: "BadgeTagNFC is a versatile NFC badge.",
-    0x15: "Skull of Fate is a mystical artifact for determining one's fate.",
-    0x14: "Another variant of the Skull of Fate.",
-    0x13: "Yet another version of the Skull of Fate.",
-    0x57: "This is a calendar"
-}
+DETAIL_LINE_LENGTH = 16  # Approximate number of characters that fit in 128px width
+DETAIL_MAX_LINES = 5     # Lines that fit below the device name
+
+def wrap_text(text):
+    """Split text into the lines display_details draws, as a tuple."""
+    text = text.strip()  # Remove any leading/trailing whitespace
+    lines = []
+    for i in range(0, len(text), DETAIL_LINE_LENGTH):
+        lines.append(text[i:i + DETAIL_LINE_LENGTH].strip())  # Remove leading whitespace for each line
+        if len(lines) == DETAIL_MAX_LINES:  # Prevent text from going off the screen
+            break
+    return tuple(lines)
+
+# The descriptions never change, so wrap them once here instead of on every redraw
+DEVICES = {key: (name, wrap_text(info)) for key, (name, info) in DEVICES.items()}
+DEFAULTS = {key: (name, wrap_text(info)) for key, (name, info) in DEFAULTS.items()}
+NO_DEVICE_INFO = wrap_text("No additional info available.")
+
+def lookup_device(address, bus):
+    """Return the (name, info lines) entry for a device, or None if it is unknown."""
+    return DEVICES.get((address, bus)) or DEFAULTS.get(address)
+
+hex_names = {}  # Names of unknown addresses, filled in as they are first found
+
+def hex_name(address):
+    """Return hex(address), reusing the same string on every rescan."""
+    name = hex_names.get(address)
+    if name is None:
+        name = hex_names[address] = hex(address)
+    return name
 
 # -------------------------
 # Function to Scan I2C Buses for Devices
@@ -589,23 +808,19 @@ def scan_devices():
     """Scan I2C buses and return a list of detected devices."""
     detected_devices = []
 
-    # Scan i2c0
-    i2c0_array = i2c0.scan()
-    for device in i2c0_array:
-        if device not in exclude_list and device not in [d["name"] for d in detected_devices]:
-            if device in device_names_i2c0:
-                detected_devices.append({"address": device, "name": device_names_i2c0[device], "bus": "i2c0"})
-            else:
-                detected_devices.append({"address": device, "name": hex(device), "bus": "i2c0"})
-
-    # Scan i2c1
-    i2c1_array = i2c1.scan()
-    for device in i2c1_array:
-        if device not in exclude_list and device not in [d["name"] for d in detected_devices]:
-            if device in device_names_i2c1:
-                detected_devices.append({"address": device, "name": device_names_i2c1[device], "bus": "i2c1"})
-            else:
-                detected_devices.append({"address": device, "name": hex(device), "bus": "i2c1"})
+    # Scan i2c0. The set difference drops excluded addresses in one operation,
+    # and sorting keeps the list order stable between refreshes.
+    i2c0_found = set(i2c0.scan()) - EXCLUDE
+    for device in sorted(i2c0_found):
+        entry = lookup_device(device, "i2c0")
+        name = entry[0] if entry else hex_name(device)
+        detected_devices.append({"address": device, "name": name, "bus": "i2c0"})
+
+    # Scan i2c1, skipping addresses already listed from i2c0 so a device is only shown once
+    for device in sorted(set(i2c1.scan()) - EXCLUDE - i2c0_found):
+        entry = lookup_device(device, "i2c1")
+        name = entry[0] if entry else hex_name(device)
+        detected_devices.append({"address": device, "name": name, "bus": "i2c1"})
 
     return detected_devices
 
@@ -617,23 +832,13 @@ def display_details(device):
     try:
         display.fill(0)
         display.text(device["name"], 0, 0, 1)
-        info_key = (device["address"], device["bus"])
-        if info_key in device_info:
-            info = device_info[info_key]
-        elif device["address"] in device_info:
-            info = device_info[device["address"]]
-        else:
-            info = "No additional info available."
+        entry = lookup_device(device["address"], device["bus"])
+        lines = entry[1] if entry else NO_DEVICE_INFO
 
         y_position = 16
-        line_length = 16  # Approximate number of characters that fit in 128px width
-        info = info.strip()  # Remove any leading/trailing whitespace
-        for i in range(0, len(info), line_length):
-            line = info[i:i + line_length].strip()  # Remove leading whitespace for each line
+        for line in lines:  # Already wrapped to the screen width
             display.text(line, 0, y_position, 1)
             y_position += 9
-            if y_position > 55:  # Prevent text from going off the screen
-                break
         display.show()
     except OSError as e:
         print(f"OSError while displaying details: {e}")
@@ -645,8 +850,7 @@ def display_list(devices, current_selection):
     """Display a list of detected I2C devices with the current selection highlighted."""
     try:
         display.fill(0)
-        display.text("Super Add Ons:", 0, 0, 1)
-        display.line(0, 9, 127, 9, 1) 
+        display.blit(HEADER_DEVICE_LIST, 0, 0)
         
         y_position = 16
         for i, device in enumerate(devices):
@@ -674,6 +878,13 @@ MODE_I2C_DETECT = 1
 MODE_I2C_DETAIL = 2
 MODE_EVENT_DISPLAY = 3
 
+# Minimum time between I2C rescans while the device list is shown
+SCAN_INTERVAL_MS = 2000
+# How often the event display checks the RTC for the next countdown second
+COUNTDOWN_POLL_MS = 100
+# Longest main() sleeps between passes when only a button press can change the screen
+IDLE_WAIT_MS = 1000
+
 # -------------------------
 # Function to Create and Save a Test Event (For Demonstration)
 # -------------------------
@@ -695,88 +906,156 @@ def create_test_event():
     # Save to EEPROM at address 0
     save_event_to_eeprom(test_event, 0)
 
+# -------------------------
+# Display State and Mode Handlers
+# -------------------------
+MAIN_MENU_OPTIONS = ("I2C Detect", "Event Display")
+
+class DisplayState:
+    """What main() keeps between passes: the mode, selections, device list and event."""
+    def __init__(self):
+        self.mode = MODE_MAIN_MENU
+        self.main_menu_selection = 0
+        # I2C navigation
+        self.i2c_devices = scan_devices()
+        self.last_scan = time.ticks_ms()
+        self.i2c_selection = 0
+        # Load an event (for demonstration purposes, loading from address 0)
+        self.event = load_event_from_eeprom(0)  # Modify as needed
+        self.time_data = None  # RTC reading taken this pass in event display
+
+# Full-screen redraw for each mode
+def render_main_menu(state):
+    display_main_menu(MAIN_MENU_OPTIONS, state.main_menu_selection)
+
+def render_device_list(state):
+    display_list(state.i2c_devices, state.i2c_selection)
+
+def render_device_detail(state):
+    if state.i2c_devices and state.i2c_selection < len(state.i2c_devices):
+        display_details(state.i2c_devices[state.i2c_selection])
+    else:
+        display.fill(0)
+        display.text("No device selected", 0, 0, 1)
+        display.show()
+
+def render_event(state):
+    if state.event:
+        display_event(state.event, time_data=state.time_data)
+    else:
+        display_no_event()
+
+RENDER = {
+    MODE_MAIN_MENU: render_main_menu,
+    MODE_I2C_DETECT: render_device_list,
+    MODE_I2C_DETAIL: render_device_detail,
+    MODE_EVENT_DISPLAY: render_event,
+}
+
+# Button actions: A moves the selection down, B selects, C returns to the previous menu
+def main_menu_next(state):
+    state.main_menu_selection = (state.main_menu_selection + 1) % len(MAIN_MENU_OPTIONS)
+
+def device_list_next(state):
+    if state.i2c_devices:
+        state.i2c_selection = (state.i2c_selection + 1) % len(state.i2c_devices)
+
+def main_menu_select(state):
+    selected_option = MAIN_MENU_OPTIONS[state.main_menu_selection]
+    if selected_option == "I2C Detect":
+        state.mode = MODE_I2C_DETECT
+        state.i2c_selection = 0  # Reset selection
+        state.i2c_devices = scan_devices()  # Fresh list on entering the mode
+        state.last_scan = time.ticks_ms()
+    elif selected_option == "Event Display":
+        state.mode = MODE_EVENT_DISPLAY
+
+def device_list_select(state):
+    if state.i2c_devices:
+        state.mode = MODE_I2C_DETAIL
+
+def back_to_device_list(state):
+    state.mode = MODE_I2C_DETECT
+
+def back_to_main_menu(state):
+    state.mode = MODE_MAIN_MENU
+
+# Button -> {mode: action}; a mode without an entry ignores that button.
+# Add more modes here if needed.
+BUTTON_ACTIONS = {
+    BUTTON_A: {
+        MODE_MAIN_MENU: main_menu_next,
+        MODE_I2C_DETECT: device_list_next,
+    },
+    BUTTON_B: {
+        MODE_MAIN_MENU: main_menu_select,
+        MODE_I2C_DETECT: device_list_select,
+    },
+    BUTTON_C: {
+        MODE_I2C_DETAIL: back_to_device_list,
+        MODE_I2C_DETECT: back_to_main_menu,
+        MODE_EVENT_DISPLAY: back_to_main_menu,
+    },
+}
+
 # -------------------------
 # Main Function to Handle Display Modes and User Interaction
 # -------------------------
 def main():
     """Main loop handling different display modes and user interactions."""
-    # Initialize variables for main menu
-    current_mode = MODE_MAIN_MENU
-    main_menu_options = ["I2C Detect", "Event Display"]
-    main_menu_selection = 0
-    main_menu_length = len(main_menu_options)
-
-    # Initialize variables for I2C navigation
-    i2c_devices = scan_devices()
-    i2c_selection = 0
+    state = DisplayState()
 
-    # Load an event (for demonstration purposes, loading from address 0)
-    event = load_event_from_eeprom(0)  # Modify as needed
+    # Pushing a frame to the OLED is the slowest part of a pass, so the screen
+    # is only redrawn when something shown on it has changed
+    redraw = True
+    countdown_changed = False  # Only the event countdown line needs redrawing
+    last_second = None  # RTC second the event countdown was last drawn for
 
     while True:
+        state.time_data = None
+        if state.mode == MODE_I2C_DETECT:
+            # Refresh the device list periodically rather than on every pass
+            now = time.ticks_ms()
+            if time.ticks_diff(now, state.last_scan) >= SCAN_INTERVAL_MS:
+                devices = scan_devices()
+                state.last_scan = now
+                if devices != state.i2c_devices:
+                    state.i2c_devices = devices
+                    redraw = True
+        elif state.mode == MODE_EVENT_DISPLAY and state.event:
+            # The countdown changes once a second
+            state.time_data = read_time()
+            second = state.time_data[6] if state.time_data else None
+            if second != last_second:
+                last_second = second
+                countdown_changed = True
+
         # Handle Mode-Based Display
-        if current_mode == MODE_MAIN_MENU:
-            display_main_menu(main_menu_options, main_menu_selection)
-        elif current_mode == MODE_I2C_DETECT:
-            i2c_devices = scan_devices()  # Refresh device list
-            display_list(i2c_devices, i2c_selection)
-        elif current_mode == MODE_I2C_DETAIL:
-            if i2c_devices and i2c_selection < len(i2c_devices):
-                selected_device = i2c_devices[i2c_selection]
-                display_details(selected_device)
-            else:
-                display.fill(0)
-                display.text("No device selected", 0, 0, 1)
-                display.show()
-        elif current_mode == MODE_EVENT_DISPLAY:
-            if event:
-                display_event(event)
-            else:
-                display_no_event()
-
-        # Handle button presses
-        if buttonA.value() == 0:  # Button A: Move selection down
-            if current_mode == MODE_MAIN_MENU:
-                main_menu_selection = (main_menu_selection + 1) % main_menu_length
-            elif current_mode == MODE_I2C_DETECT:
-                if i2c_devices:
-                    i2c_selection = (i2c_selection + 1) % len(i2c_devices)
-            # Add more modes here if needed
-            time.sleep(0.2)  # Debounce delay
-
-        elif buttonB.value() == 0:  # Button B: Select
-            if current_mode == MODE_MAIN_MENU:
-                selected_option = main_menu_options[main_menu_selection]
-                if selected_option == "I2C Detect":
-                    current_mode = MODE_I2C_DETECT
-                    i2c_selection = 0  # Reset selection
-                elif selected_option == "Event Display":
-                    current_mode = MODE_EVENT_DISPLAY
-            elif current_mode == MODE_I2C_DETECT:
-                if i2c_devices:
-                    current_mode = MODE_I2C_DETAIL
-            elif current_mode == MODE_I2C_DETAIL:
-                # Optionally, implement actions when selecting a device detail
-                pass
-            elif current_mode == MODE_EVENT_DISPLAY:
-                # Optionally, implement actions in event display
-                pass
-            # Add more modes here if needed
-            time.sleep(0.2)  # Debounce delay
-
-        elif buttonC.value() == 0:  # Button C: Return to Main Menu or previous menu
-            if current_mode == MODE_I2C_DETAIL:
-                current_mode = MODE_I2C_DETECT  # Return to I2C Detect device list
-            elif current_mode in [MODE_I2C_DETECT, MODE_EVENT_DISPLAY]:
-                current_mode = MODE_MAIN_MENU  # Return to Main Menu
-            elif current_mode == MODE_MAIN_MENU:
-                # Optionally, implement exit or do nothing
-                pass
-            # Add more modes here if needed
-            time.sleep(0.2)  # Debounce delay
-
-        # Add a small sleep to avoid excessive CPU usage
-        time.sleep(0.05)
+        if redraw:
+            RENDER[state.mode](state)
+            redraw = False
+            countdown_changed = False
+        elif countdown_changed:
+            display_event(state.event, countdown_only=True, time_data=state.time_data)
+            countdown_changed = False
+
+        # Handle queued button presses
+        button = next_button()
+        if button:
+            action = BUTTON_ACTIONS[button].get(state.mode)
+            if action:
+                action(state)
+            redraw = True
+
+        # Sleep until the next button press, or until the countdown or device
+        # list may need refreshing, instead of waking on a fixed short interval
+        if state.mode == MODE_EVENT_DISPLAY and state.event:
+            wait_ms = COUNTDOWN_POLL_MS
+        elif state.mode == MODE_I2C_DETECT:
+            wait_ms = SCAN_INTERVAL_MS - time.ticks_diff(time.ticks_ms(), state.last_scan)
+        else:
+            wait_ms = IDLE_WAIT_MS
+        wait_for_button(wait_ms)
 
 # -------------------------
 # Function to Display Main Menu
@@ -785,8 +1064,7 @@ def display_main_menu(options, selection):
     """Display the main menu with given options and current selection."""
     try:
         display.fill(0)
-        display.text("Main Menu:", 0, 0, 1)
-        display.line(0, 9, 127, 9, 1)
+        display.blit(HEADER_MAIN_MENU, 0, 0)
         
         y_position = 16
         for i, option in enumerate(options):
@@ -838,20 +1116,33 @@ def display_current_time():
 # -------------------------
 # Function to Display Event Details with Countdown
 # -------------------------
-def display_event(event):
-    """Display event details with a countdown on the OLED."""
+def display_event(event, countdown_only=False, time_data=None):
+    """
+    Display event details with a countdown on the OLED.
+    With countdown_only, only the countdown line is redrawn and sent, for when
+    the rest of the event screen is already showing. time_data is a read_time()
+    result the caller already has; the RTC is only read when it is not given.
+    """
+    # Bind the display and the event's start time once for the countdown path
+    oled = display
+    start_time = event.start_time
     try:
-        # Clear the display
-        display.fill(0)
+        # Clear the display, or just the countdown line
+        if countdown_only:
+            oled.fill_rect(0, 0, 128, 8, 0)
+        else:
+            oled.fill(0)
 
         # Get the current time
-        current_time_data = read_time()
+        current_time_data = time_data or read_time()
         if current_time_data:
-            current_time = int(time.mktime(current_time_data))
+            # read_time() includes the weekday, which time.mktime() does not take
+            year, month, date, _, hour, minute, second = current_time_data
+            current_time = int(time.mktime((year, month, date, hour, minute, second, 0, 0)))
         else:
             current_time = int(time.time())  # Fallback to epoch time if RTC fails
 
-        time_left = event.start_time - current_time
+        time_left = start_time - current_time
 
         # Determine what to display based on the countdown
         if time_left > 10:
@@ -864,40 +1155,19 @@ def display_event(event):
             countdown_string = "Event started!"
 
         # Display the countdown or event started message on the first line
-        display.text(countdown_string, 0, 0, 1)
+        oled.text(countdown_string, 0, 0, 1)
+        if countdown_only:
+            show_pages(0, 0)  # The countdown line is the first page
+            return
 
-        # Initialize y_offset for event details
+        # Event details never change, so their lines are formatted once per event
         y_offset = 16  # Start after a 16-pixel offset
-
-        # Event Name
-        display.text("Name: " + event.event_name, 0, y_offset, 1)
-        y_offset += 9
-
-        # Convert start time and end time from epoch to struct_time
-        start_time_struct = time.localtime(event.start_time)
-        end_time_struct = time.localtime(event.end_time)
-
-        # Event Start Time
-        start_time_str = "Start: {:02}:{:02}".format(
-            start_time_struct[3], start_time_struct[4])
-        display.text(start_time_str, 0, y_offset, 1)
-        y_offset += 9
-
-        # Event End Time
-        end_time_str = "End: {:02}:{:02}".format(
-            end_time_struct[3], end_time_struct[4])
-        display.text(end_time_str, 0, y_offset, 1)
-        y_offset += 9
-
-        # Speaker Name
-        display.text("Speaker: " + event.speaker_name, 0, y_offset, 1)
-        y_offset += 9
-
-        # Description (truncated if too long)
-        display.text("Desc: " + event.description[:20], 0, y_offset, 1)
+        for line in event.detail_lines:
+            oled.text(line, 0, y_offset, 1)
+            y_offset += 9
 
         # Refresh OLED display
-        display.show()
+        oled.show()
     except OSError as e:
         print(f"OSError while displaying event: {e}")
 
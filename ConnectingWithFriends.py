@@ -43,7 +43,7 @@ Screen Saver Functions: Functions to draw rectangles and circles on the OLED dis
 Payload Sending: send_payload sends data to the MacSAO and handles any exceptions.
 Rectangle Payload Creation: create_rectangle_payload creates a data payload to draw filled rectangles on the OLED.
 Y-Coordinate Mapping: map_y maps input values to Y-coordinates for positioning elements on the screen.
-Screen Saver Functions: screen_saver and screen_saver_circle handle drawing shapes on the OLED.
+Screen Saver Functions: screen_saver_init sets up the MacSAO once, then screen_saver and screen_saver_circle handle drawing shapes on the OLED.
 5. Event Handling and EEPROM Management
 Event Class: Defines an Event class to store event details.
 BCD Conversion: Utility functions dec_to_bcd and bcd_to_dec handle conversion between decimal and BCD formats for RTC operations.
@@ -55,14 +55,14 @@ Reading Touch Input: touchwheel_read retrieves the current touch input from the
 Setting RGB Colors: touchwheel_rgb sets the RGB color on the Touchwheel's central display.
 7. I2C Device Scanning and Display
 Device Mapping: Dictionaries device_names_i2c0 and device_names_i2c1 map I2C addresses to device names for both I2C buses.
-Exclusion List: exclude_list contains I2C addresses of devices that should not be displayed.
+Exclusion List: EXCLUDE is a frozenset of the I2C addresses of devices that should not be displayed.
 Device Information: device_info provides detailed descriptions for each detected device.
 Device Scanning: scan_devices scans both I2C buses, identifies connected devices, and excludes specified ones.
 Display Functions: display_details and display_list handle showing device information on the OLED display.
 8. I2C Device Command Functions
 Command Sending: send_i2c_command sends specific commands to a client device over I2C and processes the response.
 Response Decoding: decode_response interprets responses based on the command sent.
-Float Conversion: float_from_bytes converts byte data to floating-point numbers (placeholder implementation).
+Float Conversion: float_from_bytes unpacks a little-endian 32-bit float from the client's response bytes.
 9. Event Display Functions
 Display Event: display_event shows event details and a countdown timer on the OLED.
 No Event Display: display_no_event indicates when no event is scheduled.
@@ -83,7 +83,7 @@ Redundancies: The constants BLINKY_LOOP_NUM_PIXELS and BLINKY_LOOP_PIN_NUM are d
 
 Error Handling: The code includes basic error handling for I2C communications and display operations. Depending on the use case, you might want to enhance these to handle more specific scenarios.
 
-Placeholder Functions: The float_from_bytes function is a placeholder. Ensure you replace it with the actual implementation required for your application.
+Client Data Format: float_from_bytes and decode_response expect the client to send floats as little-endian IEEE 754 single precision ('<f'). Adjust the format if your client firmware sends them differently.
 
 Uncomment Sections: There are sections in the reset_time_and_event function that are commented out. Uncomment and modify them as needed for your specific event setup.
 
@@ -94,6 +94,7 @@ Documentation: Consider adding more docstrings and inline comments for complex l
 from machine import I2C, Pin
 import time
 import sys
+import struct
 import ssd1306
 import neopixel
 import etch
@@ -129,6 +130,9 @@ BLINKY_LOOP_PIN_NUM = 22           # GPIO pin number (redundant, same as above)
 # -------------------------
 EEPROM_SIZE = 4096                  # Total size of EEPROM in bytes (4KB)
 PAGE_SIZE = 32                      # EEPROM page size in bytes
+EEPROM_WRITE_TIME_MS = 10           # Worst-case EEPROM page write cycle time
+ERASED_PAGE = b'\xff' * PAGE_SIZE    # One page in the erased (all 0xFF) state
+EVENT_SIZE = 250                    # Maximum size of a serialized event in bytes
 
 # -------------------------
 # Screen Dimensions
@@ -163,6 +167,53 @@ i2c1 = I2C(1, sda=Pin(26), scl=Pin(27), freq=400_000)  # I2C1 for ports 4-6
 # -------------------------
 display = ssd1306.SSD1306_I2C(128, 64, i2c0)
 
+# Copy of the frame last sent to the OLED. The driver's init_display() sends a
+# blank frame, so it starts out all zeros.
+shown_buffer = bytearray(len(display.buffer))
+
+# Column (0x21) and page (0x22) address window in a single command transaction:
+# a 0x00 control byte followed by the command bytes. The page range is filled in per update.
+SHOW_PAGES_CMD = bytearray((0x00, 0x21, 0, display.width - 1, 0x22, 0, 0))
+
+def show_pages(first_page, last_page):
+    """
+    Send only display pages first_page..last_page (8 pixel rows each) to the OLED.
+
+    Parameters:
+        first_page (int): First page to send.
+        last_page (int): Last page to send.
+    """
+    SHOW_PAGES_CMD[5] = first_page
+    SHOW_PAGES_CMD[6] = last_page
+    display.i2c.writeto(display.addr, SHOW_PAGES_CMD)
+    # The driver's write_data sends the 0x40 data prefix and the pixels in one writevto.
+    # In horizontal addressing mode each page is one display.width-byte run of the buffer.
+    display.write_data(memoryview(display.buffer)[first_page * display.width:(last_page + 1) * display.width])
+
+def show_changed_pages():
+    """
+    Send the OLED only the pages that differ from the frame last sent.
+
+    The main loop redraws the current screen on every pass, so most frames are
+    unchanged and send nothing; a menu selection change sends only the pages
+    between the old and new selection rows.
+    """
+    buffer = display.buffer
+    if buffer == shown_buffer:
+        return
+    width = display.width
+    first_page = last_page = None
+    for page in range(display.pages):
+        start = page * width
+        if buffer[start:start + width] != shown_buffer[start:start + width]:
+            if first_page is None:
+                first_page = page
+            last_page = page
+    show_pages(first_page, last_page)
+    start = first_page * width
+    end = (last_page + 1) * width
+    shown_buffer[start:end] = buffer[start:end]
+
 # -------------------------
 # Initialize Etch SAO on I2C1
 # -------------------------
@@ -352,12 +403,22 @@ clear_pixels()
 # I2C Communication Functions
 # =========================
 
+# -------------------------
+# MacSAO Payloads
+# -------------------------
+# Fixed commands are constants; the shape payloads are reused buffers whose
+# coordinate bytes are filled in per frame, so animation frames allocate nothing
+PAYLOAD_SET_MODE_LIVEDRIVE = b'\x05\x01\x01'     # Set MODE to LIVEDRIVE (1)
+PAYLOAD_RESET_MOUSE = b'\x05\x02\x00\x00'       # Set Mouse Position to (0, 0)
+RECTANGLE_PAYLOAD = bytearray((0x01, 0x02, 0x0C, 0, 0, 0, 0, 0, 0xFE))  # x, y, width, height, color at [3:8]
+CIRCLE_PAYLOAD = bytearray((0x01, 0x02, 0x0F, 0, 0, 0, 0x01, 0xFE))     # x, y, radius at [3:6]
+
 def send_payload(payload, description):
     """
     Send a payload via I2C to the MacSAO and handle exceptions.
 
     Args:
-        payload (bytes): Data payload to send.
+        payload (bytes or bytearray): Data payload to send.
         description (str): Description of the payload for debugging.
     """
     try:
@@ -379,9 +440,15 @@ def create_rectangle_payload(x, y, width, height, color):
         color (int): 0 for black, 1 for white.
 
     Returns:
-        bytes: The payload to send via I2C.
+        bytearray: The payload to send via I2C. This is the shared
+        RECTANGLE_PAYLOAD buffer, so send it before creating the next one.
     """
-    return bytes([0x01, 0x02, 0x0C, x, y, width, height, color, 0xFE])
+    RECTANGLE_PAYLOAD[3] = x
+    RECTANGLE_PAYLOAD[4] = y
+    RECTANGLE_PAYLOAD[5] = width
+    RECTANGLE_PAYLOAD[6] = height
+    RECTANGLE_PAYLOAD[7] = color
+    return RECTANGLE_PAYLOAD
 
 def map_y(input_val, screen_height=48, rect_height=15):
     """
@@ -399,35 +466,41 @@ def map_y(input_val, screen_height=48, rect_height=15):
     y = max(0, min(y, screen_height - rect_height))
     return y
 
+def screen_saver_init():
+    """
+    Put the MacSAO into LIVEDRIVE mode with the mouse at (0, 0), once before the animation starts.
+    """
+    # Set MODE to LIVEDRIVE (1)
+    send_payload(PAYLOAD_SET_MODE_LIVEDRIVE, "Set MODE to LIVEDRIVE (1)")
+    time.sleep(0.1)
+
+    # Set Mouse Position to (0, 0)
+    send_payload(PAYLOAD_RESET_MOUSE, "Set Mouse Position to (0,0)")
+    time.sleep(0.1)
+
 def screen_saver(y_left, y_right):
     """
     Draw the current frame of the screensaver with two rectangles.
 
+    The MacSAO stays in LIVEDRIVE mode once screen_saver_init() has set it, so
+    frames only park the mouse at (0, 0) and draw, with no settling delays.
+
     Parameters:
         y_left (int): Y-coordinate for the left rectangle.
         y_right (int): Y-coordinate for the right rectangle.
     """
-    # Set MODE to LIVEDRIVE (1)
-    payload_set_mode = bytes([0x05, 0x01, 0x01])
-    send_payload(payload_set_mode, "Set MODE to LIVEDRIVE (1)")
-    time.sleep(0.02)
-
-    # Set Mouse Position to (0, 0)
-    payload_set_mouse_position = bytes([0x05, 0x02, 0x00, 0x00])
-    send_payload(payload_set_mouse_position, "Reset Mouse Position to (0,0)")
-    time.sleep(0.02)
+    # Keep the mouse parked at (0, 0)
+    send_payload(PAYLOAD_RESET_MOUSE, "Reset Mouse Position to (0,0)")
 
-    # Define Rectangle Payloads
+    # Draw the rectangles; both share one payload buffer, so each is sent before the next is built
     payload_draw_left_rect = create_rectangle_payload(
         x=0, y=y_left, width=5, height=15, color=0x00
     )
+    send_payload(payload_draw_left_rect, "Draw Left Rectangle")
     payload_draw_right_rect = create_rectangle_payload(
         x=59, y=y_right, width=5, height=15, color=0x00
     )
-
-    # Draw the rectangles
-    send_payload(payload_draw_left_rect, f"Draw Left Rectangle at (0,{y_left})")
-    send_payload(payload_draw_right_rect, f"Draw Right Rectangle at (59,{y_right})")
+    send_payload(payload_draw_right_rect, "Draw Right Rectangle")
 
 def screen_saver_circle(x, y, radius):
     """
@@ -439,8 +512,10 @@ def screen_saver_circle(x, y, radius):
         radius (int): Radius of the circle.
     """
     # Payload to draw the circle
-    payload_draw_circle = bytes([0x01, 0x02, 0x0F, x, y, radius, 0x01, 0xFE])
-    send_payload(payload_draw_circle, f"Draw Circle at ({x},{y})")
+    CIRCLE_PAYLOAD[3] = x
+    CIRCLE_PAYLOAD[4] = y
+    CIRCLE_PAYLOAD[5] = radius
+    send_payload(CIRCLE_PAYLOAD, "Draw Circle")
     time.sleep(0.02)  # Short delay
 
 # =========================
@@ -456,13 +531,18 @@ class Event:
         self.speaker_name = speaker_name
         self.description = description
 
+# Lookup tables built once so conversions are a single index operation
+DEC_TO_BCD = bytes((val // 10 << 4) + (val % 10) for val in range(100))
+BCD_TO_DEC = bytes(((val >> 4) * 10) + (val & 0x0F) for val in range(256))
+RTC_BUF = bytearray(7)  # Reusable buffer for the seven DS3231 timekeeping registers
+
 def dec_to_bcd(val):
-    """Convert decimal to BCD."""
-    return (val // 10 << 4) + (val % 10)
+    """Convert decimal (0-99) to BCD."""
+    return DEC_TO_BCD[val]
 
 def bcd_to_dec(val):
     """Convert BCD to decimal."""
-    return ((val >> 4) * 10) + (val & 0x0F)
+    return BCD_TO_DEC[val]
 
 def set_time(year, month, date, day, hour, minute, second):
     """
@@ -487,8 +567,10 @@ def set_time(year, month, date, day, hour, minute, second):
         dec_to_bcd(month),
         dec_to_bcd(year)
     ])
+    global rtc_epoch
     try:
         i2c0.writeto_mem(DS3231_I2C_ADDR, 0x00, data)
+        rtc_epoch = None  # The cached time no longer matches the RTC
         print("Time set successfully.")
     except OSError as e:
         print("Failed to set time:", e)
@@ -501,19 +583,59 @@ def read_time():
         tuple or None: (year, month, date, day, hour, minute, second) or None if failed.
     """
     try:
-        data = i2c0.readfrom_mem(DS3231_I2C_ADDR, 0x00, 7)
-        second = bcd_to_dec(data[0])
-        minute = bcd_to_dec(data[1])
-        hour = bcd_to_dec(data[2])
-        day = bcd_to_dec(data[3])
-        date = bcd_to_dec(data[4])
-        month = bcd_to_dec(data[5] & 0x1F)
-        year = bcd_to_dec(data[6]) + 2000
+        data = RTC_BUF
+        i2c0.readfrom_mem_into(DS3231_I2C_ADDR, 0x00, data)
+        second = BCD_TO_DEC[data[0]]
+        minute = BCD_TO_DEC[data[1]]
+        hour = BCD_TO_DEC[data[2]]
+        day = BCD_TO_DEC[data[3]]
+        date = BCD_TO_DEC[data[4]]
+        month = BCD_TO_DEC[data[5] & 0x1F]
+        year = BCD_TO_DEC[data[6]] + 2000
         return (year, month, date, day, hour, minute, second)
     except OSError as e:
         print("Failed to read time:", e)
         return None
 
+RTC_RESYNC_MS = 30_000  # How long current_epoch() counts ticks_ms before reading the RTC again
+rtc_epoch = None        # Epoch time at the last RTC read, or None to read it on next use
+rtc_epoch_ticks = 0     # time.ticks_ms() at the last RTC read
+
+def current_epoch():
+    """
+    Return the current time as an epoch, for once-a-second countdowns.
+
+    The RTC is read at most every RTC_RESYNC_MS; in between, the elapsed
+    ticks_ms are added to the epoch from the last read. A failed resync
+    keeps counting from the cached epoch and is retried RTC_RESYNC_MS later.
+
+    Returns:
+        int or None: Epoch time or None if the RTC could not be read.
+    """
+    global rtc_epoch, rtc_epoch_ticks
+    now = time.ticks_ms()
+    if rtc_epoch is None or time.ticks_diff(now, rtc_epoch_ticks) >= RTC_RESYNC_MS:
+        time_data = read_time()
+        if time_data:
+            (year, month, date, day, hour, minute, second) = time_data
+
+            # Adjust the day of the week to match Python's convention (Monday=0)
+            # DS3231 RTC day starts from 1 (Sunday) to 7 (Saturday)
+            weekday = (day + 5) % 7  # Converts 1-7 (Sun-Sat) to 0-6 (Mon-Sun)
+
+            # Construct time tuple for mktime
+            time_tuple = (year, month, date, hour, minute, second, weekday, -1)
+            rtc_epoch = int(time.mktime(time_tuple))
+            rtc_epoch_ticks = now
+        elif rtc_epoch is None:
+            return None
+        else:
+            # Move the cached reading forward to now, so the RTC is not retried on every call
+            elapsed = time.ticks_diff(now, rtc_epoch_ticks)
+            rtc_epoch += elapsed // 1000
+            rtc_epoch_ticks = time.ticks_add(now, -(elapsed % 1000))
+    return rtc_epoch + time.ticks_diff(now, rtc_epoch_ticks) // 1000
+
 def read_temperature():
     """
     Read the temperature from DS3231 RTC.
@@ -522,8 +644,11 @@ def read_temperature():
         float or None: Temperature in °C or None if failed.
     """
     try:
-        temp_msb = i2c0.readfrom_mem(DS3231_I2C_ADDR, 0x11, 1)[0]
-        temp_lsb = i2c0.readfrom_mem(DS3231_I2C_ADDR, 0x12, 1)[0]
+        # MSB (0x11) and LSB (0x12) are consecutive, so read both at once
+        temp_msb, temp_lsb = i2c0.readfrom_mem(DS3231_I2C_ADDR, 0x11, 2)
+        # MSB is a two's complement integer part; convert for sub-zero values
+        if temp_msb & 0x80:
+            temp_msb -= 256
         temp = temp_msb + ((temp_lsb >> 6) * 0.25)
         print(f"Read Temperature: {temp:.2f}°C")
         return temp
@@ -531,22 +656,43 @@ def read_temperature():
         print("Failed to read temperature:", e)
         return None
 
+def wait_for_eeprom_write():
+    """
+    Wait for the EEPROM to finish its internal write cycle.
+
+    The EEPROM does not acknowledge its address while a write cycle is in
+    progress, so poll it until it does (ACK polling), giving up after the
+    worst-case write time.
+    """
+    deadline = time.ticks_add(time.ticks_ms(), EEPROM_WRITE_TIME_MS)
+    while True:
+        try:
+            i2c0.writeto(EEPROM_I2C_ADDR, b'')
+            return
+        except OSError:
+            if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+                return
+            time.sleep_us(200)
+
 def write_bytes_to_eeprom(address, data):
     """
     Write bytes to EEPROM starting at the specified address.
 
     Parameters:
         address (int): Starting address in EEPROM.
-        data (bytes): Data to write.
+        data (bytes, bytearray or memoryview): Data to write.
     """
-    while data:
-        chunk = data[:PAGE_SIZE]
-        data = data[PAGE_SIZE:]
+    mv = memoryview(data)  # Page slices reference data instead of copying it
+    offset = 0
+    while offset < len(mv):
+        # Never cross a page boundary, or the EEPROM wraps around within the page
+        chunk_size = min(PAGE_SIZE - address % PAGE_SIZE, len(mv) - offset)
         try:
             # Use writeto_mem with two-byte address
-            i2c0.writeto_mem(EEPROM_I2C_ADDR, address, chunk, addrsize=16)
-            time.sleep_ms(10)  # Ensure EEPROM write cycle completes
-            address += len(chunk)
+            i2c0.writeto_mem(EEPROM_I2C_ADDR, address, mv[offset:offset + chunk_size], addrsize=16)
+            wait_for_eeprom_write()  # Returns as soon as the write cycle completes
+            address += chunk_size
+            offset += chunk_size
         except OSError as e:
             print("Failed to write to EEPROM:", e)
             break
@@ -575,10 +721,12 @@ def wipe_eeprom():
     print("Wiping EEPROM...")
     for addr in range(0, EEPROM_SIZE, PAGE_SIZE):
         remaining = EEPROM_SIZE - addr
-        chunk_size = PAGE_SIZE if remaining >= PAGE_SIZE else remaining
-        chunk = bytearray([0xFF] * chunk_size)
+        chunk = ERASED_PAGE if remaining >= PAGE_SIZE else memoryview(ERASED_PAGE)[:remaining]
         try:
-            write_bytes_to_eeprom(addr, chunk)
+            # Pages are already aligned, so write them directly rather than
+            # through write_bytes_to_eeprom() and its per-call message
+            i2c0.writeto_mem(EEPROM_I2C_ADDR, addr, chunk, addrsize=16)
+            wait_for_eeprom_write()
         except Exception as e:
             print(f"Failed to wipe EEPROM at address {addr}: {e}")
             return
@@ -619,13 +767,16 @@ def read_string_from_eeprom(address, length):
         print(f"Failed to read {length} bytes from EEPROM at address {address}")
         return None
 
-def save_event_to_eeprom(event, address):
+def save_event_to_eeprom(event, address, verify=False):
     """
     Serialize and save an event to EEPROM at the specified address.
 
     Parameters:
         event (Event): Event object to save.
         address (int): Starting EEPROM address.
+        verify (bool): Read the record back and compare it after writing.
+            Off by default, as it doubles the I2C traffic of every save;
+            without it, a failed or corrupted write goes unnoticed.
     """
     data = bytearray()
 
@@ -637,18 +788,14 @@ def save_event_to_eeprom(event, address):
     data.append(len(event_name_bytes))
     data.extend(event_name_bytes)
 
-    # Start Time (4 bytes)
-    data.extend(event.start_time.to_bytes(4, 'big'))
-
-    # End Time (4 bytes)
-    data.extend(event.end_time.to_bytes(4, 'big'))
-
-    # Speaker Name
+    # Speaker Name (encoded first, as its length is packed with the times)
     speaker_name_bytes = event.speaker_name.encode('utf-8')
     if len(speaker_name_bytes) > 50:
         print("Speaker name too long! Maximum 50 bytes allowed.")
         return
-    data.append(len(speaker_name_bytes))
+
+    # Start Time (4 bytes), End Time (4 bytes) and Speaker Name Length (1 byte)
+    data.extend(struct.pack('>IIB', event.start_time, event.end_time, len(speaker_name_bytes)))
     data.extend(speaker_name_bytes)
 
     # Description
@@ -656,12 +803,12 @@ def save_event_to_eeprom(event, address):
     if len(description_bytes) > 138:
         print("Description too long! Maximum 138 bytes allowed.")
         return
-    data.extend(len(description_bytes).to_bytes(2, 'big'))
+    data.extend(struct.pack('>H', len(description_bytes)))
     data.extend(description_bytes)
 
-    # Ensure total data length does not exceed 250 bytes
-    if len(data) > 250:
-        print(f"Serialized event size {len(data)} exceeds 250 bytes. Cannot save.")
+    # Ensure total data length does not exceed EVENT_SIZE
+    if len(data) > EVENT_SIZE:
+        print(f"Serialized event size {len(data)} exceeds {EVENT_SIZE} bytes. Cannot save.")
         return
 
     # Write data to EEPROM
@@ -669,28 +816,56 @@ def save_event_to_eeprom(event, address):
     print("Event saved successfully.")
 
     # Optional Verification
-    verification_data = read_bytes_from_eeprom(address, len(data))
-    if verification_data == data:
-        print("Verification Successful: Data written correctly.")
-    else:
-        print("Verification Failed: Data mismatch.")
+    if verify:
+        verification_data = read_bytes_from_eeprom(address, len(data))
+        if verification_data == data:
+            print("Verification Successful: Data written correctly.")
+        else:
+            print("Verification Failed: Data mismatch.")
+
+def decode_event_string(data, offset, length, field):
+    """
+    Decode a UTF-8 string field from an event record read out of EEPROM.
+
+    Parameters:
+        data (memoryview): Event record.
+        offset (int): Offset of the field in the record.
+        length (int): Length of the field in bytes.
+        field (str): Field name for error messages.
+
+    Returns:
+        str or None: Decoded string or None if truncated or invalid.
+    """
+    if offset + length > len(data):
+        print(f"Invalid {field}: event record truncated at offset {offset}.")
+        return None
+    try:
+        return str(data[offset:offset + length], 'utf-8')
+    except ValueError as e:
+        print(f"Failed to decode {field} from EEPROM:", e)
+        return None
 
 def load_event_from_eeprom(address):
     """
     Load and deserialize an event from EEPROM starting at the specified address.
 
+    The whole event slot is read in one I2C transaction and the fields are
+    parsed from a memoryview of it.
+
     Parameters:
         address (int): Starting EEPROM address.
 
     Returns:
         Event or None: Loaded event object or None if failed.
     """
-    # Read Event Name Length
-    event_name_length_bytes = read_bytes_from_eeprom(address, 1)
-    if event_name_length_bytes is None:
-        print("Failed to read event name length.")
+    record = read_bytes_from_eeprom(address, min(EVENT_SIZE, EEPROM_SIZE - address))
+    if record is None:
+        print("Failed to read event from EEPROM.")
         return None
-    event_name_length = event_name_length_bytes[0]
+    data = memoryview(record)
+
+    # Event Name Length
+    event_name_length = data[0]
 
     # Check if the entire event slot is empty
     if event_name_length == 0xFF:
@@ -701,70 +876,50 @@ def load_event_from_eeprom(address):
     if event_name_length == 0 or event_name_length > 50:
         print(f"Invalid event name length ({event_name_length}) at address {address}.")
         return None
-    address += 1
+    offset = 1
 
-    # Read Event Name
-    event_name = read_string_from_eeprom(address, event_name_length)
+    # Event Name
+    event_name = decode_event_string(data, offset, event_name_length, "event name")
     if event_name is None:
-        print(f"Invalid event name at address {address}.")
         return None
-    address += event_name_length
+    offset += event_name_length
 
-    # Read Start Time
-    start_time_bytes = read_bytes_from_eeprom(address, 4)
-    if start_time_bytes is None or len(start_time_bytes) != 4:
-        print("Failed to read start time.")
+    # Start Time, End Time and Speaker Name Length
+    if offset + 9 > len(data):
+        print("Failed to read event times.")
         return None
-    start_time = int.from_bytes(start_time_bytes, 'big')
-    address += 4
-
-    # Read End Time
-    end_time_bytes = read_bytes_from_eeprom(address, 4)
-    if end_time_bytes is None or len(end_time_bytes) != 4:
-        print("Failed to read end time.")
-        return None
-    end_time = int.from_bytes(end_time_bytes, 'big')
-    address += 4
-
-    # Read Speaker Name Length
-    speaker_name_length_bytes = read_bytes_from_eeprom(address, 1)
-    if speaker_name_length_bytes is None:
-        print("Failed to read speaker name length.")
-        return None
-    speaker_name_length = speaker_name_length_bytes[0]
+    # Unpack all three fixed-size fields in one call, mirroring the struct.pack in save_event_to_eeprom
+    start_time, end_time, speaker_name_length = struct.unpack_from('>IIB', data, offset)
+    offset += 8
 
     # Validate speaker_name_length
     if speaker_name_length == 0 or speaker_name_length > 50:
-        print(f"Invalid speaker name length ({speaker_name_length}) at address {address}.")
+        print(f"Invalid speaker name length ({speaker_name_length}) at address {address + offset}.")
         return None
-    address += 1
+    offset += 1
 
-    # Read Speaker Name
-    speaker_name = read_string_from_eeprom(address, speaker_name_length)
+    # Speaker Name
+    speaker_name = decode_event_string(data, offset, speaker_name_length, "speaker name")
     if speaker_name is None:
-        print(f"Invalid speaker name at address {address}.")
         return None
-    address += speaker_name_length
+    offset += speaker_name_length
 
-    # Read Description Length
-    description_length_bytes = read_bytes_from_eeprom(address, 2)
-    if description_length_bytes is None or len(description_length_bytes) != 2:
+    # Description Length
+    if offset + 2 > len(data):
         print("Failed to read description length.")
         return None
-    description_length = int.from_bytes(description_length_bytes, 'big')
+    description_length = struct.unpack_from('>H', data, offset)[0]
 
     # Validate description_length
     if description_length == 0 or description_length > 138:
-        print(f"Invalid description length ({description_length}) at address {address}.")
+        print(f"Invalid description length ({description_length}) at address {address + offset}.")
         return None
-    address += 2
+    offset += 2
 
-    # Read Description
-    description = read_string_from_eeprom(address, description_length)
+    # Description
+    description = decode_event_string(data, offset, description_length, "description")
     if description is None:
-        print(f"Invalid description at address {address}.")
         return None
-    address += description_length
 
     # Create Event object
     event = Event(event_name, start_time, end_time, speaker_name, description)
@@ -793,9 +948,8 @@ def touchwheel_rgb(bus, r, g, b):
         g (int): Green value (0-255).
         b (int): Blue value (0-255).
     """
-    bus.writeto_mem(TOUCHWHEEL_ADDRESS, 15, bytes([r]))
-    bus.writeto_mem(TOUCHWHEEL_ADDRESS, 16, bytes([g]))
-    bus.writeto_mem(TOUCHWHEEL_ADDRESS, 17, bytes([b]))
+    # Registers 15-17 are consecutive, so write all three in one transaction
+    bus.writeto_mem(TOUCHWHEEL_ADDRESS, 15, bytes((r, g, b)))
 
 # =========================
 # I2C Device Scanning and Display
@@ -830,10 +984,11 @@ device_names_i2c1 = {
 # -------------------------
 # Devices to Exclude from Display
 # -------------------------
-exclude_list = {
-    0x3C: "OLED Display",
-    0x68: "EEPROM Calendar"
-}
+# Built once as a set so each scanned address is a single membership test
+EXCLUDE = frozenset((
+    OLED_ADDRESS,     # OLED Display
+    DS3231_I2C_ADDR,  # Calendar RTC
+))
 
 # -------------------------
 # Detailed Device Information
@@ -850,6 +1005,23 @@ device_info = {
     0x0A: "Mac SAO by SirCastor"
 }
 
+hex_names = {}  # Names of unknown addresses, filled in as they are first found
+
+def hex_name(address):
+    """
+    Return hex(address), reusing the same string on every rescan.
+
+    Parameters:
+        address (int): I2C address.
+
+    Returns:
+        str: The address in hex, e.g. "0x33".
+    """
+    name = hex_names.get(address)
+    if name is None:
+        name = hex_names[address] = hex(address)
+    return name
+
 def scan_devices():
     """
     Scan both I2C buses and return a list of detected devices excluding certain addresses.
@@ -858,57 +1030,54 @@ def scan_devices():
         list: List of detected devices with their addresses, names, and bus.
     """
     detected_devices = []
+    seen = set()  # Addresses already listed, so a device on both buses is listed once
 
     # Scan I2C0
     i2c0_array = i2c0.scan()
     for device in i2c0_array:
-        if device not in exclude_list and device not in [d["address"] for d in detected_devices]:
-            if device in device_names_i2c0:
-                detected_devices.append({"address": device, "name": device_names_i2c0[device], "bus": "i2c0"})
-            else:
-                detected_devices.append({"address": device, "name": hex(device), "bus": "i2c0"})
+        if device not in EXCLUDE and device not in seen:
+            seen.add(device)
+            name = device_names_i2c0.get(device) or hex_name(device)
+            detected_devices.append({"address": device, "name": name, "bus": "i2c0"})
 
     # Scan I2C1
     i2c1_array = i2c1.scan()
     for device in i2c1_array:
-        if device not in exclude_list and device not in [d["address"] for d in detected_devices]:
-            if device in device_names_i2c1:
-                detected_devices.append({"address": device, "name": device_names_i2c1[device], "bus": "i2c1"})
-            else:
-                detected_devices.append({"address": device, "name": hex(device), "bus": "i2c1"})
+        if device not in EXCLUDE and device not in seen:
+            seen.add(device)
+            name = device_names_i2c1.get(device) or hex_name(device)
+            detected_devices.append({"address": device, "name": name, "bus": "i2c1"})
 
     return detected_devices
 
-def display_details(device):
+# Info text wrapped into OLED lines, keyed by (address, bus) and filled on first view
+detail_lines_cache = {}
+DETAIL_LINE_LENGTH = 16  # Approximate number of characters that fit in 128px width
+DETAIL_MAX_LINES = 5     # Lines that fit below the device name
+
+def detail_lines(device):
     """
-    Display detailed information of a specific device on the OLED.
+    Return the wrapped info lines for a device, wrapping them on first use.
 
     Parameters:
         device (dict): Device information containing address, name, and bus.
+
+    Returns:
+        tuple: Info lines to draw below the device name.
     """
-    try:
-        display.fill(0)
-        display.text(device["name"], 0, 0, 1)
-        info_key = (device["address"], device["bus"])
-        if info_key in device_info:
-            info = device_info[info_key]
-        elif device["address"] in device_info:
-            info = device_info[device["address"]]
-        else:
-            info = "No additional info available."
+    info_key = (device["address"], device["bus"])
+    lines = detail_lines_cache.get(info_key)
+    if lines is None:
+        # A (address, bus) entry takes precedence over the address-only one
+        info = device_info.get(info_key) or device_info.get(device["address"], "No additional info available.")
 
-        y_position = 16
-        line_length = 16  # Approximate number of characters that fit in 128px width
         info = info.strip()  # Remove any leading/trailing whitespace
-        for i in range(0, len(info), line_length):
-            line = info[i:i + line_length].strip()  # Remove leading whitespace for each line
-            display.text(line, 0, y_position, 1)
-            y_position += 9
-            if y_position > 55:  # Prevent text from going off the screen
-                break
-        display.show()
-    except OSError as e:
-        print(f"OSError while displaying details: {e}")
+        lines = tuple(
+            info[i:i + DETAIL_LINE_LENGTH].strip()  # Remove leading whitespace for each line
+            for i in range(0, len(info), DETAIL_LINE_LENGTH)
+        )[:DETAIL_MAX_LINES]
+        detail_lines_cache[info_key] = lines
+    return lines
 
 def display_list(devices, current_selection):
     """
@@ -933,7 +1102,7 @@ def display_list(devices, current_selection):
             if y_position > 55:  # Prevent text from going off the screen
                 break
 
-        display.show()
+        show_changed_pages()
     except OSError as e:
         print(f"OSError while displaying list: {e}")
 
@@ -947,24 +1116,12 @@ def display_details(device):
     try:
         display.fill(0)
         display.text(device["name"], 0, 0, 1)
-        info_key = (device["address"], device["bus"])
-        if info_key in device_info:
-            info = device_info[info_key]
-        elif device["address"] in device_info:
-            info = device_info[device["address"]]
-        else:
-            info = "No additional info available."
 
         y_position = 16
-        line_length = 16  # Approximate number of characters that fit in 128px width
-        info = info.strip()  # Remove any leading/trailing whitespace
-        for i in range(0, len(info), line_length):
-            line = info[i:i + line_length].strip()  # Remove leading whitespace for each line
+        for line in detail_lines(device):
             display.text(line, 0, y_position, 1)
             y_position += 9
-            if y_position > 55:  # Prevent text from going off the screen
-                break
-        display.show()
+        show_changed_pages()
     except OSError as e:
         print(f"OSError while displaying details: {e}")
 
@@ -972,6 +1129,38 @@ def display_details(device):
 # I2C Device Command Functions
 # =========================
 
+# The client keeps its previous reply readable until it has handled a new
+# command, so no reply is accepted before CLIENT_SETTLE_MS (the original fixed
+# wait). After that, a client that is still busy and NACKs is polled again
+# instead of failing the command.
+CLIENT_SETTLE_MS = 100            # Time the client is given to replace its previous reply
+CLIENT_RESPONSE_TIMEOUT_MS = 100  # Further time to keep polling a client that NACKs
+CLIENT_POLL_MS = 2                # Delay between polls of a NACKing client
+
+def read_client_response(response_length):
+    """
+    Read the client's response once it has had time to handle the command.
+
+    Waits CLIENT_SETTLE_MS so a reply left over from the previous command is
+    never read as this one's, then reads. While the client NACKs, the read is
+    retried every CLIENT_POLL_MS for up to CLIENT_RESPONSE_TIMEOUT_MS.
+
+    Args:
+        response_length (int): Number of bytes expected in response.
+
+    Returns:
+        bytes: The data received from the client.
+    """
+    time.sleep_ms(CLIENT_SETTLE_MS)
+    deadline = time.ticks_add(time.ticks_ms(), CLIENT_RESPONSE_TIMEOUT_MS)
+    while time.ticks_diff(deadline, time.ticks_ms()) > 0:
+        try:
+            return i2c0.readfrom(0x13, response_length)
+        except OSError:
+            time.sleep_ms(CLIENT_POLL_MS)  # Still busy
+    # Never answered: one last read, letting its error reach the caller
+    return i2c0.readfrom(0x13, response_length)
+
 def send_i2c_command(command_char, data_bytes=None, response_length=1):
     """
     Send a command over I2C to the client and receive response if expected.
@@ -988,12 +1177,9 @@ def send_i2c_command(command_char, data_bytes=None, response_length=1):
     try:
         i2c0.writeto(0x13, data_to_send)
 
-        # Optional: Wait for a response from the CLIENT
-        time.sleep(0.1)  # Small delay to allow CLIENT to respond
-
-        # Read the expected number of bytes from the CLIENT
+        # Read the expected number of bytes from the CLIENT as soon as it responds
         if response_length > 0:
-            data_received = i2c0.readfrom(0x13, response_length)
+            data_received = read_client_response(response_length)
             if data_received:
                 decode_response(command_char, data_received)
             else:
@@ -1021,9 +1207,8 @@ def decode_response(command_char, data):
         if len(data) != 12:
             print("Error: Incorrect data length for accelerometer data.")
             return
-        x = float_from_bytes(data[0:4])
-        y = float_from_bytes(data[4:8])
-        z = float_from_bytes(data[8:12])
+        # Three little-endian floats, unpacked in one call without slicing
+        x, y, z = struct.unpack('<fff', data)
         print(f"Accelerometer Data - X: {x:.2f}, Y: {y:.2f}, Z: {z:.2f}")
     elif command_char == '5':
         # Button states (1 byte)
@@ -1043,19 +1228,18 @@ def decode_response(command_char, data):
         status = data[0]
         print(f"Received status from CLIENT: {chr(status)}")
 
-def float_from_bytes(bytes_data):
+def float_from_bytes(bytes_data, offset=0):
     """
-    Convert 4 bytes to a float. Placeholder function.
+    Convert 4 bytes to a float.
 
     Parameters:
-        bytes_data (bytes): 4 bytes representing a float.
+        bytes_data (bytes): Data containing a little-endian float.
+        offset (int): Offset of the float in bytes_data.
 
     Returns:
         float: Converted float value.
     """
-    # Placeholder implementation. Replace with actual conversion as needed.
-    import struct
-    return struct.unpack('f', bytes_data)[0]
+    return struct.unpack_from('<f', bytes_data, offset)[0]
 
 # =========================
 # Event Display Functions
@@ -1072,19 +1256,9 @@ def display_event(event):
         # Clear the display
         display.fill(0)
 
-        # Get the current time from the RTC
-        time_data = read_time()
-        if time_data:
-            (year, month, date, day, hour, minute, second) = time_data
-
-            # Adjust the day of the week to match Python's convention (Monday=0)
-            # DS3231 RTC day starts from 1 (Sunday) to 7 (Saturday)
-            weekday = (day + 5) % 7  # Converts 1-7 (Sun-Sat) to 0-6 (Mon-Sun)
-
-            # Construct time tuple for mktime
-            time_tuple = (year, month, date, hour, minute, second, weekday, -1)
-            current_time = time.mktime(time_tuple)
-        else:
+        # Get the current time, from the RTC at most every RTC_RESYNC_MS
+        current_time = current_epoch()
+        if current_time is None:
             # If reading time failed, handle appropriately
             current_time = 0  # Or consider skipping the update
             print("Failed to read current time from RTC.")
@@ -1143,7 +1317,7 @@ def display_event(event):
         display.text("Desc: " + event.description[:20], 0, y_offset, 1)
 
         # Refresh OLED display
-        display.show()
+        show_changed_pages()
     except OSError as e:
         print(f"OSError while displaying event: {e}")
 
@@ -1152,7 +1326,7 @@ def display_no_event():
     try:
         display.fill(0)
         display.text("No Event Scheduled", 0, 0, 1)
-        display.show()
+        show_changed_pages()
     except OSError as e:
         print(f"OSError while displaying no event: {e}")
 
@@ -1179,7 +1353,7 @@ def display_main_menu(options, selection):
             if y_position > 55:  # Prevent text from going off the screen
                 break
 
-        display.show()
+        show_changed_pages()
     except OSError as e:
         print(f"OSError while displaying main menu: {e}")
 
@@ -1203,16 +1377,7 @@ def pong():
     Initialize I2C and start the pong animation with moving circles and rectangles.
     """
     print("Initializing I2C and starting the screensaver...")
-
-    # Set MODE to LIVEDRIVE (1)
-    payload_set_mode = bytes([0x05, 0x01, 0x01])
-    send_payload(payload_set_mode, "Set MODE to LIVEDRIVE (1)")
-    time.sleep(0.1)
-
-    # Set Mouse Position to (0, 0)
-    payload_set_mouse_position = bytes([0x05, 0x02, 0x00, 0x00])
-    send_payload(payload_set_mouse_position, "Set Mouse Position to (0,0)")
-    time.sleep(0.1)
+    screen_saver_init()
 
     # Circle parameters
     x = SCREEN_WIDTH // 2  # Start at center x = 32
@@ -1324,7 +1489,7 @@ def main():
             else:
                 display.fill(0)
                 display.text("No device selected", 0, 0, 1)
-                display.show()
+                show_changed_pages()
         elif current_mode == MODE_EVENT_DISPLAY:
             if event:
                 display_event(event)